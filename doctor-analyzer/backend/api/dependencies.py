@@ -1,6 +1,10 @@
 """FastAPI dependency injection setup."""
 
 from functools import lru_cache
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
 
 from config.settings import Settings, get_settings
 from infrastructure.aws.s3_client import S3Client
@@ -10,6 +14,7 @@ from infrastructure.aws.comprehend_client import ComprehendClient
 from infrastructure.aws.bedrock_client import BedrockClient
 from infrastructure.websocket.connection_manager import ConnectionManager
 from domain.session import SessionStoreProtocol
+from infrastructure.database.engine import session_scope
 from infrastructure.database.session_repository import PostgresSessionStore
 from infrastructure.database.patient_repository import PatientRepository
 from services.upload_service import UploadService
@@ -34,6 +39,24 @@ def get_cached_settings() -> Settings:
     return get_settings()
 
 
+class DbScopedRoute(APIRoute):
+    """Route that shares one database session and commit across a request's repository calls.
+
+    The whole handler, dependencies included, runs inside session_scope(),
+    so the transaction commits before the response is returned rather than
+    at dependency teardown after it has been sent.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def scoped_handler(request: Request) -> Response:
+            async with session_scope():
+                return await handler(request)
+
+        return scoped_handler
+
+
 def get_connection_manager() -> ConnectionManager:
     """Get WebSocket connection manager singleton."""
     global _connection_manager
@@ -72,20 +95,23 @@ def get_s3_client() -> S3Client:
     return S3Client(settings.aws)
 
 
+@lru_cache()
 def get_rekognition_client() -> RekognitionClient:
-    """Get Rekognition client."""
+    """Get Rekognition client (shared, so one SQS listener serves every job waiter)."""
     settings = get_cached_settings()
     return RekognitionClient(settings.aws)
 
 
+@lru_cache()
 def get_transcribe_client() -> TranscribeClient:
-    """Get Transcribe client."""
+    """Get Transcribe client (shared, so its connection pool stays warm)."""
     settings = get_cached_settings()
     return TranscribeClient(settings.aws)
 
 
+@lru_cache()
 def get_comprehend_client() -> ComprehendClient:
-    """Get Comprehend client."""
+    """Get Comprehend client (shared, so its connection pool stays warm)."""
     settings = get_cached_settings()
     return ComprehendClient(settings.aws)
 
@@ -137,8 +163,9 @@ def get_injury_check_service() -> InjuryCheckService:
     )
 
 
+@lru_cache()
 def get_bedrock_client() -> BedrockClient:
-    """Get Bedrock Runtime client."""
+    """Get Bedrock Runtime client (shared, so its connection pool stays warm)."""
     settings = get_cached_settings()
     return BedrockClient(settings.aws)
 
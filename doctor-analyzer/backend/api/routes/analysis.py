@@ -1,7 +1,9 @@
 """Analysis API endpoints."""
 
-import json
+import asyncio
 import logging
+
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,12 @@ async def start_analysis(
             detail=f"Analysis already started. Current status: {session.status.value}",
         )
 
+    if session.video_s3_key and not await upload_service.confirm_video_upload(session):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Video for session {session_id} has not finished uploading",
+        )
+
     ws_manager = get_connection_manager()
     logger.info(
         f"Queuing analysis pipeline for session {session_id} "
@@ -107,27 +115,43 @@ async def run_analysis_pipeline(
 
     try:
         if session.video_s3_key:
-            logger.info(f"[{session_id}] Starting video analysis: {session.video_s3_key}")
-            await video_service.analyze_video(session)
-            session = await session_store.get(session_id)
+            # Start content moderation now so Rekognition runs it alongside
+            # face detection; its results are read at the injury check step.
+            moderation_job = asyncio.create_task(
+                injury_check_service.start_moderation_job(session)
+            )
 
-            logger.info(f"[{session_id}] Running injury check (Rekognition)")
             try:
-                result = await injury_check_service.run_injury_check(session)
-                session.injury_check = result
-                await session_store.update(session)
-            except Exception as e:
-                logger.exception(f"Injury check failed for session {session_id}: %s", e)
-                session.injury_check = InjuryCheckResult(
-                    enabled=True,
-                    rekognition_labels=[],
-                    has_signals=False,
-                    summary="",
-                    confidence=0.0,
-                    error_message=str(e),
-                )
-                await session_store.update(session)
-            session = await session_store.get(session_id)
+                logger.info(f"[{session_id}] Starting video analysis: {session.video_s3_key}")
+                await video_service.analyze_video(session)
+                session = await session_store.get(session_id)
+
+                logger.info(f"[{session_id}] Running injury check (Rekognition)")
+                try:
+                    result = await injury_check_service.run_injury_check(session, moderation_job)
+                    session.injury_check = result
+                    await session_store.update(session)
+                except Exception as e:
+                    logger.exception(f"Injury check failed for session {session_id}: %s", e)
+                    session.injury_check = InjuryCheckResult(
+                        enabled=True,
+                        rekognition_labels=[],
+                        has_signals=False,
+                        summary="",
+                        confidence=0.0,
+                        error_message=str(e),
+                    )
+                    await session_store.update(session)
+                session = await session_store.get(session_id)
+            finally:
+                # Don't orphan the start request if anything above failed
+                # before the injury check consumed it. Rekognition has no
+                # stop API for video jobs, so a job it already accepted just
+                # finishes on its own and its results go unread.
+                if not moderation_job.done():
+                    moderation_job.cancel()
+                elif not moderation_job.cancelled():
+                    moderation_job.exception()
 
             logger.info(f"[{session_id}] Starting audio analysis")
             await audio_service.analyze_audio(session)
@@ -137,11 +161,7 @@ async def run_analysis_pipeline(
         if session.injury_check:
             try:
                 logger.info(f"[{session_id}] Running Bedrock-enhanced injury interpretation")
-                enhanced = await bedrock_service.enhance_injury_interpretation(session)
-                session.injury_check = enhanced
-                transcript_analysis = await bedrock_service.analyze_transcript_for_injuries(session)
-                if transcript_analysis:
-                    session.injury_check.transcript_analysis = transcript_analysis
+                session.injury_check = await bedrock_service.enhance_injury_check(session)
                 await session_store.update(session)
                 session = await session_store.get(session_id)
             except Exception as e:
@@ -212,7 +232,7 @@ async def get_analysis_results(
     if session.results_s3_key:
         try:
             data = await s3_client.download_file(session.results_s3_key)
-            result = json.loads(data)
+            result = orjson.loads(data)
         except Exception as e:
             logger.warning(f"Failed to load final report from S3 for {session_id}: {e}")
 
@@ -220,7 +240,7 @@ async def get_analysis_results(
     transcription_key = f"sessions/{session_id}/results/transcription.json"
     try:
         data = await s3_client.download_file(transcription_key)
-        transcription_data = json.loads(data)
+        transcription_data = orjson.loads(data)
         if result.get("audio_analysis") is None:
             result["audio_analysis"] = transcription_data
         elif "segments" not in result["audio_analysis"]:
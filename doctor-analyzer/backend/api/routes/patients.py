@@ -5,9 +5,13 @@ from pydantic import BaseModel
 
 from services.patient_service import PatientService
 from domain.session import SessionStoreProtocol
-from api.dependencies import get_patient_service, get_session_store
+from api.dependencies import get_patient_service, get_session_store, DbScopedRoute
 
-router = APIRouter(prefix="/patients", tags=["patients"])
+router = APIRouter(
+    prefix="/patients",
+    tags=["patients"],
+    route_class=DbScopedRoute,
+)
 
 
 class CreatePatientRequest(BaseModel):
@@ -33,9 +37,9 @@ async def list_patients(
     patient_service: PatientService = Depends(get_patient_service),
 ):
     """List all patients."""
-    patients = await patient_service.list_patients()
+    patients = [p.to_dict() async for p in patient_service.iter_patients()]
     return {
-        "patients": [p.to_dict() for p in patients],
+        "patients": patients,
         "total": len(patients),
     }
 
@@ -75,7 +79,7 @@ async def get_patient_sessions(
     if not patient:
         raise HTTPException(status_code=404, detail=f"Patient {patient_id} not found")
 
-    sessions = await session_store.list_by_patient(patient_id)
+    sessions = await session_store.list_summaries(patient_id)
     return {
         "sessions": [s.to_dict() for s in sessions],
         "total": len(sessions),
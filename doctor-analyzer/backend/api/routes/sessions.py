@@ -1,18 +1,21 @@
 """Session management API endpoints."""
 
-import json
 from typing import Optional
 
 from botocore.exceptions import ClientError
 from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from services.upload_service import UploadService
 from infrastructure.aws.s3_client import S3Client
 from domain.session import SessionStoreProtocol
-from api.dependencies import get_upload_service, get_session_store, get_s3_client
+from api.dependencies import get_upload_service, get_session_store, get_s3_client, DbScopedRoute
 
-router = APIRouter(prefix="/sessions", tags=["sessions"])
+router = APIRouter(
+    prefix="/sessions",
+    tags=["sessions"],
+    route_class=DbScopedRoute,
+)
 
 
 @router.get("")
@@ -21,10 +24,7 @@ async def list_sessions(
     session_store: SessionStoreProtocol = Depends(get_session_store),
 ):
     """List all analysis sessions, optionally filtered by patient_id."""
-    if patient_id:
-        sessions = await session_store.list_by_patient(patient_id)
-    else:
-        sessions = await session_store.list_all()
+    sessions = await session_store.list_summaries(patient_id)
 
     return {
         "sessions": [s.to_dict() for s in sessions],
@@ -83,8 +83,8 @@ async def get_face_detections(
     s3_key = f"sessions/{session_id}/results/face_detections.json"
     try:
         data = await s3_client.download_file(s3_key)
-        detections = json.loads(data)
-        return JSONResponse(content=detections)
+        # Stored as JSON already; pass the bytes through without re-encoding
+        return Response(content=data, media_type="application/json")
     except ClientError:
         raise HTTPException(
             status_code=404,
@@ -1,6 +1,7 @@
 """Upload API endpoints."""
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from pydantic import BaseModel
 
 from services.upload_service import UploadService
 from services.patient_service import PatientService
@@ -17,6 +18,12 @@ ALLOWED_VIDEO_TYPES = [
 ]
 
 
+class PresignVideoRequest(BaseModel):
+    patient_id: str
+    filename: str
+    content_type: str
+
+
 @router.post("/video")
 async def upload_video(
     file: UploadFile = File(...),
@@ -58,3 +65,47 @@ async def upload_video(
         "video_s3_key": s3_key,
         "status": session.status.value,
     }
+
+
+@router.post("/video/presign")
+async def presign_video_upload(
+    body: PresignVideoRequest,
+    upload_service: UploadService = Depends(get_upload_service),
+    patient_service: PatientService = Depends(get_patient_service),
+):
+    """
+    Create a session and a presigned URL for uploading the video directly to S3.
+
+    The client PUTs the file to `upload_url` with the same Content-Type, then
+    calls POST /api/analysis/{session_id}/start. The video bytes never pass
+    through the backend.
+    """
+    if not await patient_service.patient_exists(body.patient_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Patient {body.patient_id} not found. Create the patient first.",
+        )
+
+    if body.content_type not in ALLOWED_VIDEO_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type '{body.content_type}'. Allowed: {ALLOWED_VIDEO_TYPES}",
+        )
+
+    session = await upload_service.create_session(patient_id=body.patient_id)
+
+    try:
+        s3_key, upload_url = await upload_service.presign_video_upload(
+            session.session_id, body.filename, body.content_type,
+        )
+    except Exception as e:
+        # Don't leave a session behind that no upload can ever reach
+        await upload_service.delete_session(session.session_id)
+        raise HTTPException(status_code=500, detail=f"Presign failed: {str(e)}")
+
+    return {
+        "session_id": session.session_id,
+        "video_s3_key": s3_key,
+        "upload_url": upload_url,
+        "status": session.status.value,
+    }
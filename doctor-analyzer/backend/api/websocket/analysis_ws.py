@@ -21,6 +21,7 @@ async def analysis_websocket(
     - status_update: Analysis pipeline status changes
     - emotion_update: Real-time emotion detections with timestamps
     - transcription_update: Transcription segments as processed
+    - transcription_batch: Several transcription segments in one frame
     - complete: Final aggregated results
     - error: Error messages
 
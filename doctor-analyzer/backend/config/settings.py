@@ -15,8 +15,10 @@ class AWSSettings:
     access_key_id: str = os.getenv("AWS_ACCESS_KEY_ID", "")
     secret_access_key: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
     s3_bucket: str = os.getenv("S3_BUCKET", "doctor-analyzer-uploads")
+    s3_max_pool_connections: int = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "64"))
     rekognition_role_arn: str = os.getenv("REKOGNITION_ROLE_ARN", "")
     sns_topic_arn: str = os.getenv("SNS_TOPIC_ARN", "")
+    rekognition_sqs_queue_url: str = os.getenv("REKOGNITION_SQS_QUEUE_URL", "")
     bedrock_model_id: str = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-3-sonnet-20240229-v1:0")
 
 
@@ -1,7 +1,8 @@
 """Analysis result domain models."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -31,7 +32,9 @@ class SentimentResult:
     mixed_score: float
     source_text: str = ""
 
-    def to_dict(self) -> dict:
+    @cached_property
+    def _dict(self) -> dict:
+        # Frozen, so the serialized form can be built once and reused.
         return {
             "sentiment": self.sentiment,
             "positive_score": self.positive_score,
@@ -40,6 +43,10 @@ class SentimentResult:
             "mixed_score": self.mixed_score,
         }
 
+    def to_dict(self) -> dict:
+        """Serialized form; cached, so callers must treat it as read-only."""
+        return self._dict
+
 
 @dataclass(frozen=True)
 class TranscriptionSegment:
@@ -69,8 +76,10 @@ class AudioAnalysis:
     overall_sentiment: Optional[SentimentResult] = None
     segment_sentiments: List[SentimentResult] = field(default_factory=list)
 
-    @property
+    @cached_property
     def full_transcript(self) -> str:
+        # Segments are set once when transcription finishes; the joined text
+        # is read by serialization and every Bedrock prompt, so build it once.
         return " ".join(seg.text for seg in self.transcription)
 
     def to_dict(self) -> dict:
@@ -82,22 +91,28 @@ class AudioAnalysis:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClinicalIndicator:
     """Clinical indicator derived from analysis."""
 
     indicator_type: str  # discomfort, depression, anxiety, fear
     confidence: float
-    evidence: List[str] = field(default_factory=list)
-    timestamp_ranges: List[Dict] = field(default_factory=list)
+    evidence: Tuple[str, ...] = ()
+    timestamp_ranges: Tuple[Dict, ...] = ()
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return {
-            "indicator_type": self.indicator_type,
-            "confidence": self.confidence,
-            "evidence": self.evidence,
-            "timestamp_ranges": self.timestamp_ranges,
-        }
+        """Serialized form; cached, so callers must treat it as read-only."""
+        d = self._dict
+        if d is None:
+            d = {
+                "indicator_type": self.indicator_type,
+                "confidence": self.confidence,
+                "evidence": self.evidence,
+                "timestamp_ranges": self.timestamp_ranges,
+            }
+            object.__setattr__(self, "_dict", d)
+        return d
 
 
 @dataclass
@@ -86,10 +86,15 @@ class VideoEmotionTimeline:
     video_id: str
     duration_ms: int
     detections: List[FaceDetection] = field(default_factory=list)
+    # Serialized form of each added detection, built once on insertion
+    detection_dicts: List[dict] = field(default_factory=list, repr=False, compare=False)
 
-    def add_detection(self, detection: FaceDetection) -> None:
-        """Add a detection to the timeline."""
+    def add_detection(self, detection: FaceDetection) -> dict:
+        """Add a detection to the timeline and return its serialized form."""
         self.detections.append(detection)
+        detection_dict = detection.to_dict()
+        self.detection_dicts.append(detection_dict)
+        return detection_dict
 
     def get_detections_at(self, timestamp_ms: int, tolerance_ms: int = 500) -> List[FaceDetection]:
         """Get detections within tolerance of timestamp."""
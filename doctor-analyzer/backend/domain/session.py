@@ -2,7 +2,7 @@
 
 import abc
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 from datetime import datetime
 
 from domain.analysis import (
@@ -64,6 +64,17 @@ class AnalysisSession:
             "bedrock_aggregation": self.bedrock_aggregation,
         }
 
+    def to_summary(self) -> "AnalysisSessionSummary":
+        """Project onto the lightweight view used by list endpoints."""
+        return AnalysisSessionSummary(
+            session_id=self.session_id,
+            created_at=self.created_at,
+            status=self.status,
+            patient_id=self.patient_id,
+            updated_at=self.updated_at,
+            error_message=self.error_message,
+        )
+
     def to_full_dict(self) -> dict:
         """Convert to full dictionary including all analysis results."""
         base = self.to_dict()
@@ -75,6 +86,28 @@ class AnalysisSession:
         return base
 
 
+@dataclass(frozen=True)
+class AnalysisSessionSummary:
+    """Lightweight session view for list endpoints (no analysis payloads)."""
+
+    session_id: str
+    created_at: datetime
+    status: AnalysisStatus
+    patient_id: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "patient_id": self.patient_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "status": self.status.value,
+            "error_message": self.error_message,
+        }
+
+
 class SessionStoreProtocol(abc.ABC):
     """Abstract interface for session persistence."""
 
@@ -96,6 +129,17 @@ class SessionStoreProtocol(abc.ABC):
     @abc.abstractmethod
     async def list_by_patient(self, patient_id: str) -> List[AnalysisSession]: ...
 
+    @abc.abstractmethod
+    async def list_summaries(
+        self, patient_id: Optional[str] = None,
+    ) -> List[AnalysisSessionSummary]: ...
+
+    @abc.abstractmethod
+    def iter_all(self) -> AsyncIterator[AnalysisSession]: ...
+
+    @abc.abstractmethod
+    def iter_by_patient(self, patient_id: str) -> AsyncIterator[AnalysisSession]: ...
+
 
 class InMemorySessionStore(SessionStoreProtocol):
     """Simple in-memory session store."""
@@ -127,6 +171,22 @@ class InMemorySessionStore(SessionStoreProtocol):
     async def list_by_patient(self, patient_id: str) -> List[AnalysisSession]:
         return [s for s in self._sessions.values() if s.patient_id == patient_id]
 
+    async def list_summaries(
+        self, patient_id: Optional[str] = None,
+    ) -> List[AnalysisSessionSummary]:
+        sessions = (
+            await self.list_by_patient(patient_id) if patient_id else await self.list_all()
+        )
+        return [s.to_summary() for s in sessions]
+
+    async def iter_all(self) -> AsyncIterator[AnalysisSession]:
+        for session in list(self._sessions.values()):
+            yield session
+
+    async def iter_by_patient(self, patient_id: str) -> AsyncIterator[AnalysisSession]:
+        for session in await self.list_by_patient(patient_id):
+            yield session
+
 
 # Backward-compatible alias
 SessionStore = InMemorySessionStore
@@ -1,21 +1,25 @@
 """AWS Bedrock client for LLM-based analysis."""
 
-import json
 import re
-import boto3
-import asyncio
 import logging
-from functools import partial
 from typing import Any, Dict, Optional
 
+import orjson
 from botocore.config import Config as BotoConfig
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 
 logger = logging.getLogger(__name__)
 
-_RETRY_CONFIG = BotoConfig(
+# Keep-alive pool shared by every invocation on this client, sized so the
+# concurrent use cases of several sessions reuse warm TLS connections.
+_CLIENT_CONFIG = CLIENT_CONFIG.merge(BotoConfig(
     retries={"max_attempts": 3, "mode": "adaptive"},
-)
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=2,
+))
 
 
 class BedrockClient:
@@ -24,18 +28,14 @@ class BedrockClient:
     def __init__(self, settings: AWSSettings):
         self._settings = settings
         self._model_id = settings.bedrock_model_id
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             "bedrock-runtime",
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
-            config=_RETRY_CONFIG,
+            config=_CLIENT_CONFIG,
         )
 
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous boto3 call in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await run_sync(func, *args, **kwargs)
 
     async def invoke_model(
         self,
@@ -50,7 +50,7 @@ class BedrockClient:
         Returns:
             The text content of the model response.
         """
-        body = json.dumps(
+        body = orjson.dumps(
             {
                 "anthropic_version": "bedrock-2023-05-31",
                 "max_tokens": max_tokens,
@@ -67,7 +67,7 @@ class BedrockClient:
             body=body,
         )
 
-        response_body = json.loads(response["body"].read())
+        response_body = orjson.loads(response["body"].read())
         text = response_body["content"][0]["text"]
 
         usage = response_body.get("usage", {})
@@ -89,7 +89,7 @@ class BedrockClient:
         """Invoke model and parse the response as JSON.
 
         Falls back to regex extraction of the first JSON object if
-        ``json.loads`` fails on the full response.
+        ``orjson.loads`` fails on the full response.
 
         Returns:
             Parsed dict, or ``None`` if parsing fails entirely.
@@ -98,16 +98,16 @@ class BedrockClient:
 
         # Try direct parse
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             pass
 
         # Try extracting JSON block from markdown fences or raw braces
         match = re.search(r"\{[\s\S]*\}", text)
         if match:
             try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(match.group())
+            except orjson.JSONDecodeError:
                 pass
 
         logger.warning("Could not parse Bedrock response as JSON: %.200s", text)
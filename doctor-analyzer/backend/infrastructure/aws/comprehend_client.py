@@ -1,33 +1,118 @@
 """AWS Comprehend client for sentiment analysis."""
 
-import boto3
-from typing import List, Optional
-from functools import partial
+from typing import Any, Callable, List, Optional
 import asyncio
 import logging
 
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 from domain.analysis import SentimentResult
 
 logger = logging.getLogger(__name__)
 
+# Comprehend accepts at most 25 documents per batch_detect_* call
+BATCH_LIMIT = 25
+
+
+def _truncate(text: str) -> str:
+    """Truncate text to fit Comprehend's 5000-byte document limit."""
+    if len(text.encode('utf-8')) > 5000:
+        return text[:4500]
+    return text
+
+
+def _parse_sentiment(result: dict, text: str) -> SentimentResult:
+    scores = result['SentimentScore']
+    return SentimentResult(
+        sentiment=result['Sentiment'],
+        positive_score=scores['Positive'],
+        negative_score=scores['Negative'],
+        neutral_score=scores['Neutral'],
+        mixed_score=scores['Mixed'],
+        source_text=text[:200],  # Store first 200 chars for reference
+    )
+
+
+def _parse_key_phrases(result: dict, text: str) -> List[str]:
+    # Return phrases sorted by score
+    phrases = sorted(
+        result['KeyPhrases'],
+        key=lambda x: x['Score'],
+        reverse=True,
+    )
+    return [p['Text'] for p in phrases]
+
+
+def _parse_entities(result: dict, text: str) -> List[dict]:
+    return [
+        {
+            'type': entity['Type'],
+            'text': entity['Text'],
+            'score': entity['Score'],
+            'begin_offset': entity['BeginOffset'],
+            'end_offset': entity['EndOffset'],
+        }
+        for entity in result['Entities']
+    ]
+
+
+def _parse_dominant_language(result: dict, text: str) -> str:
+    languages = result['Languages']
+    if languages:
+        return languages[0]['LanguageCode']
+    return 'en'  # Default to English
+
 
 class ComprehendClient:
     """Wrapper for AWS Comprehend NLP analysis."""
 
     def __init__(self, settings: AWSSettings):
         self._settings = settings
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             'comprehend',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            config=CLIENT_CONFIG,
         )
 
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous boto3 call in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await run_sync(func, *args, **kwargs)
+
+    async def _batch_detect(
+        self,
+        operation: Callable,
+        texts: List[str],
+        parse: Callable[[dict, str], Any],
+        **params,
+    ) -> List[Optional[Any]]:
+        """
+        Run a batch_detect_* operation, splitting into concurrent calls of 25.
+
+        Returns:
+            Parsed results aligned with `texts`; None where Comprehend
+            reported an error for that item
+        """
+        if len(texts) > BATCH_LIMIT:
+            batches = await asyncio.gather(*(
+                self._batch_detect(operation, texts[i:i + BATCH_LIMIT], parse, **params)
+                for i in range(0, len(texts), BATCH_LIMIT)
+            ))
+            return [result for batch in batches for result in batch]
+
+        truncated_texts = [_truncate(text) for text in texts]
+        response = await self._run_sync(operation, TextList=truncated_texts, **params)
+
+        results: List[Optional[Any]] = [None] * len(truncated_texts)
+        for result in response['ResultList']:
+            index = result['Index']
+            results[index] = parse(result, truncated_texts[index])
+
+        for error in response.get('ErrorList', []):
+            logger.warning(
+                f"{operation.__name__} failed for item {error['Index']}: {error.get('ErrorMessage')}"
+            )
+
+        return results
 
     async def detect_sentiment(
         self,
@@ -45,77 +130,40 @@ class ComprehendClient:
             SentimentResult with sentiment and scores
         """
         # Truncate text if too long (Comprehend limit is 5000 bytes)
-        if len(text.encode('utf-8')) > 5000:
-            text = text[:4500]
+        truncated = _truncate(text)
+        if truncated is not text:
             logger.warning("Text truncated for sentiment analysis")
 
         response = await self._run_sync(
             self._client.detect_sentiment,
-            Text=text,
+            Text=truncated,
             LanguageCode=language_code,
         )
-
-        scores = response['SentimentScore']
-        return SentimentResult(
-            sentiment=response['Sentiment'],
-            positive_score=scores['Positive'],
-            negative_score=scores['Negative'],
-            neutral_score=scores['Neutral'],
-            mixed_score=scores['Mixed'],
-            source_text=text[:200],  # Store first 200 chars for reference
-        )
+        return _parse_sentiment(response, truncated)
 
     async def batch_detect_sentiment(
         self,
         texts: List[str],
         language_code: str = 'en',
-    ) -> List[SentimentResult]:
+    ) -> List[Optional[SentimentResult]]:
         """
         Detect sentiment for multiple texts in batch.
 
         Args:
-            texts: List of texts to analyze (max 25 items)
+            texts: List of texts to analyze; split into concurrent calls of 25
             language_code: Language code
 
         Returns:
-            List of SentimentResult
+            List of SentimentResult aligned with `texts`; None where Comprehend
+            reported an error for that item
         """
-        # Comprehend batch limit is 25
-        if len(texts) > 25:
-            results = []
-            for i in range(0, len(texts), 25):
-                batch = texts[i:i + 25]
-                results.extend(await self.batch_detect_sentiment(batch, language_code))
-            return results
-
-        # Truncate texts if needed
-        truncated_texts = []
-        for text in texts:
-            if len(text.encode('utf-8')) > 5000:
-                truncated_texts.append(text[:4500])
-            else:
-                truncated_texts.append(text)
-
-        response = await self._run_sync(
+        return await self._batch_detect(
             self._client.batch_detect_sentiment,
-            TextList=truncated_texts,
+            texts,
+            _parse_sentiment,
             LanguageCode=language_code,
         )
 
-        results = []
-        for i, result in enumerate(response['ResultList']):
-            scores = result['SentimentScore']
-            results.append(SentimentResult(
-                sentiment=result['Sentiment'],
-                positive_score=scores['Positive'],
-                negative_score=scores['Negative'],
-                neutral_score=scores['Neutral'],
-                mixed_score=scores['Mixed'],
-                source_text=truncated_texts[result['Index']][:200],
-            ))
-
-        return results
-
     async def detect_key_phrases(
         self,
         text: str,
@@ -131,23 +179,13 @@ class ComprehendClient:
         Returns:
             List of key phrases
         """
-        if len(text.encode('utf-8')) > 5000:
-            text = text[:4500]
-
+        text = _truncate(text)
         response = await self._run_sync(
             self._client.detect_key_phrases,
             Text=text,
             LanguageCode=language_code,
         )
-
-        # Return phrases sorted by score
-        phrases = sorted(
-            response['KeyPhrases'],
-            key=lambda x: x['Score'],
-            reverse=True,
-        )
-
-        return [p['Text'] for p in phrases]
+        return _parse_key_phrases(response, text)
 
     async def detect_entities(
         self,
@@ -164,25 +202,13 @@ class ComprehendClient:
         Returns:
             List of entity dictionaries with type, text, and score
         """
-        if len(text.encode('utf-8')) > 5000:
-            text = text[:4500]
-
+        text = _truncate(text)
         response = await self._run_sync(
             self._client.detect_entities,
             Text=text,
             LanguageCode=language_code,
         )
-
-        return [
-            {
-                'type': entity['Type'],
-                'text': entity['Text'],
-                'score': entity['Score'],
-                'begin_offset': entity['BeginOffset'],
-                'end_offset': entity['EndOffset'],
-            }
-            for entity in response['Entities']
-        ]
+        return _parse_entities(response, text)
 
     async def detect_dominant_language(self, text: str) -> str:
         """
@@ -192,7 +218,4 @@ class ComprehendClient:
             Language code (e.g., 'en', 'es', 'pt')
         """
         response = await self._run_sync(self._client.detect_dominant_language, Text=text[:5000])
-        languages = response['Languages']
-        if languages:
-            return languages[0]['LanguageCode']
-        return 'en'  # Default to English
+        return _parse_dominant_language(response, text)
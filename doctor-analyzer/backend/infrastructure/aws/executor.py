@@ -0,0 +1,19 @@
+"""Thread pool shared by the boto3 client wrappers."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# boto3 calls block, so every wrapper runs them here rather than on the
+# loop's default executor (min(32, cpu_count + 4) threads, shared with
+# anything else). Sized to the clients' connection pools so concurrent
+# fan-out is bounded by AWS, not by thread availability.
+AWS_MAX_WORKERS = 64
+
+_executor = ThreadPoolExecutor(max_workers=AWS_MAX_WORKERS, thread_name_prefix="aws")
+
+
+async def run_sync(func, *args, **kwargs):
+    """Run a synchronous boto3 call on the shared AWS thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
@@ -1,12 +1,14 @@
 """AWS Rekognition client for video emotion analysis and content moderation."""
 
-import boto3
-from typing import List, AsyncIterator, Optional, Dict, Any
+from typing import List, AsyncIterator, Awaitable, Callable, Optional, Dict, Any
 import asyncio
-from functools import partial
 import logging
 
+import orjson
+from botocore.exceptions import BotoCoreError, ClientError
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 from domain.emotion import (
     EmotionType,
     EmotionScore,
@@ -16,6 +18,12 @@ from domain.emotion import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds per SQS long poll when waiting for job completion notifications
+_SQS_WAIT_SECONDS = 20
+
+# Seconds between direct job status checks while waiting for a notification
+_STATUS_CHECK_SECONDS = 30
+
 # Rekognition emotion to our EmotionType mapping
 EMOTION_MAPPING = {
     "HAPPY": EmotionType.HAPPY,
@@ -34,13 +42,23 @@ class RekognitionClient:
 
     def __init__(self, settings: AWSSettings):
         self._settings = settings
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             'rekognition',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            config=CLIENT_CONFIG,
         )
 
+        # SQS queue subscribed to the SNS topic Rekognition notifies on job completion
+        self._sqs = None
+        if settings.rekognition_sqs_queue_url:
+            self._sqs = get_session(settings).client('sqs', config=CLIENT_CONFIG)
+        # job_id -> future resolved with the status from its completion notification
+        self._job_waiters: Dict[str, asyncio.Future] = {}
+        self._notification_listener: Optional[asyncio.Task] = None
+
+    async def _run_sync(self, func, *args, **kwargs):
+        """Run a synchronous boto3 call in a thread pool."""
+        return await run_sync(func, *args, **kwargs)
+
     async def start_face_detection(self, s3_bucket: str, s3_key: str) -> str:
         """
         Start asynchronous face detection job.
@@ -65,22 +83,114 @@ class RekognitionClient:
                 'RoleArn': self._settings.rekognition_role_arn,
             }
 
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, partial(self._client.start_face_detection, **params)
-        )
+        response = await self._run_sync(self._client.start_face_detection, **params)
         job_id = response['JobId']
         logger.info(f"Started face detection job: {job_id}")
         return job_id
 
     async def get_face_detection_status(self, job_id: str) -> str:
         """Get status of face detection job."""
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, partial(self._client.get_face_detection, JobId=job_id, MaxResults=1)
-        )
+        response = await self._run_sync(self._client.get_face_detection, JobId=job_id, MaxResults=1)
         return response['JobStatus']
 
+    async def await_job_completion(
+        self,
+        job_id: str,
+        get_status: Callable[[str], Awaitable[str]],
+        timeout: float = 1800.0,
+    ) -> Optional[str]:
+        """
+        Wait for a video job's SNS completion notification on the SQS queue.
+
+        The job status is also checked every `_STATUS_CHECK_SECONDS`, so a
+        lost or undelivered notification costs one check interval rather
+        than the whole timeout.
+
+        Args:
+            job_id: Rekognition job ID
+            get_status: Returns the current status of a job by ID
+
+        Returns:
+            The job status, or None when no queue is configured or the job
+            did not finish in time; callers then fall back to polling.
+        """
+        if self._sqs is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._job_waiters[job_id] = future
+        if self._notification_listener is None or self._notification_listener.done():
+            self._notification_listener = asyncio.create_task(self._listen_for_notifications())
+
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"No completion notification for job {job_id}, falling back to polling")
+                    return None
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.shield(future),
+                        min(_STATUS_CHECK_SECONDS, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                status = await get_status(job_id)
+                if status != 'IN_PROGRESS':
+                    return status
+        finally:
+            self._job_waiters.pop(job_id, None)
+
+    async def _listen_for_notifications(self) -> None:
+        """Long-poll the SQS queue and resolve waiters by JobId until none remain."""
+        queue_url = self._settings.rekognition_sqs_queue_url
+
+        try:
+            while self._job_waiters:
+                response = await self._run_sync(
+                    self._sqs.receive_message,
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=10,
+                    WaitTimeSeconds=_SQS_WAIT_SECONDS,
+                )
+
+                for message in response.get('Messages', []):
+                    notification = self._parse_notification(message['Body'])
+                    future = self._job_waiters.get(notification.get('JobId'))
+                    if future is not None and not future.done():
+                        future.set_result(notification.get('Status'))
+                    # Malformed and unknown-job messages are dropped too, or
+                    # they would be redelivered to every long poll; a waiter
+                    # that missed its message still sees the status check.
+                    await self._run_sync(
+                        self._sqs.delete_message,
+                        QueueUrl=queue_url,
+                        ReceiptHandle=message['ReceiptHandle'],
+                    )
+        except Exception as e:
+            logger.error(f"Failed to receive Rekognition notifications: {e}")
+        finally:
+            # Hand any remaining waiters back to polling
+            for future in self._job_waiters.values():
+                if not future.done():
+                    future.set_result(None)
+
+    @staticmethod
+    def _parse_notification(body: str) -> dict:
+        """Unwrap a Rekognition notification from its SNS envelope, if any."""
+        try:
+            payload = orjson.loads(body)
+            if isinstance(payload, dict) and 'JobId' not in payload and 'Message' in payload:
+                payload = orjson.loads(payload['Message'])
+            if isinstance(payload, dict):
+                return payload
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+        logger.warning("Ignoring malformed Rekognition notification")
+        return {}
+
     async def get_face_detection_results(
         self,
         job_id: str,
@@ -89,8 +199,12 @@ class RekognitionClient:
         """
         Poll for and yield face detection results as they become available.
 
-        This is designed for streaming results back to the frontend.
+        This is designed for streaming results back to the frontend. With an
+        SQS queue configured, waits for the completion notification instead
+        of polling, then pages through the results without sleeping.
         """
+        await self.await_job_completion(job_id, self.get_face_detection_status)
+
         next_token = None
         job_complete = False
 
@@ -99,10 +213,7 @@ class RekognitionClient:
             if next_token:
                 kwargs['NextToken'] = next_token
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, partial(self._client.get_face_detection, **kwargs)
-            )
+            response = await self._run_sync(self._client.get_face_detection, **kwargs)
             status = response['JobStatus']
 
             if status == 'FAILED':
@@ -157,14 +268,16 @@ class RekognitionClient:
                 'SNSTopicArn': self._settings.sns_topic_arn,
                 'RoleArn': self._settings.rekognition_role_arn,
             }
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, partial(self._client.start_content_moderation, **params)
-        )
+        response = await self._run_sync(self._client.start_content_moderation, **params)
         job_id = response['JobId']
         logger.info(f"Started content moderation job: {job_id}")
         return job_id
 
+    async def get_content_moderation_status(self, job_id: str) -> str:
+        """Get status of content moderation job."""
+        response = await self._run_sync(self._client.get_content_moderation, JobId=job_id, MaxResults=1)
+        return response['JobStatus']
+
     async def get_content_moderation_results(
         self,
         job_id: str,
@@ -174,7 +287,10 @@ class RekognitionClient:
         Poll for and yield content moderation results as they become available.
 
         Yields dicts with: name, confidence (0-1), timestamp_ms, parent_name.
+        Waits for the completion notification first, like get_face_detection_results.
         """
+        await self.await_job_completion(job_id, self.get_content_moderation_status)
+
         next_token = None
         job_complete = False
 
@@ -183,10 +299,7 @@ class RekognitionClient:
             if next_token:
                 kwargs['NextToken'] = next_token
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, partial(self._client.get_content_moderation, **kwargs)
-            )
+            response = await self._run_sync(self._client.get_content_moderation, **kwargs)
             status = response['JobStatus']
 
             if status == 'FAILED':
@@ -264,10 +377,7 @@ class RekognitionClient:
 
     async def detect_faces_in_image(self, image_bytes: bytes) -> List[FaceDetection]:
         """Detect faces in a single image (for testing/preview)."""
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, partial(self._client.detect_faces, Image={'Bytes': image_bytes}, Attributes=['ALL'])
-        )
+        response = await self._run_sync(self._client.detect_faces, Image={'Bytes': image_bytes}, Attributes=['ALL'])
 
         detections = []
         for face in response.get('FaceDetails', []):
@@ -1,28 +1,46 @@
 """AWS S3 client for file storage operations."""
 
-import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO
-from functools import partial
-import asyncio
-import json
+from typing import List, Optional, BinaryIO
 import logging
 
+import orjson
+
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 
 logger = logging.getLogger(__name__)
 
+# Session videos are uploaded as multipart: 16 MB parts, 8 in flight, so the
+# uplink stays saturated and a failed part only retries that chunk.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 ** 2,
+    multipart_chunksize=16 * 1024 ** 2,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_LIMIT = 1000
+
 
 class S3Client:
     """Wrapper for AWS S3 operations."""
 
     def __init__(self, settings: AWSSettings):
         self._settings = settings
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             's3',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            # Multipart parts, batched deletes and concurrent result writes
+            # all fan out; botocore's default pool of 10 would serialize them.
+            config=CLIENT_CONFIG.merge(BotoConfig(
+                max_pool_connections=settings.s3_max_pool_connections,
+                signature_version='s3v4',
+                tcp_keepalive=True,
+            )),
         )
         self._bucket = settings.s3_bucket
 
@@ -32,8 +50,7 @@ class S3Client:
 
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous boto3 call in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await run_sync(func, *args, **kwargs)
 
     async def upload_file(
         self,
@@ -44,6 +61,9 @@ class S3Client:
         """
         Upload a file to S3.
 
+        Files above 8 MB go through a parallel multipart upload; boto3
+        orders the parts on completion and aborts the upload on failure.
+
         Args:
             file_obj: File-like object to upload
             s3_key: S3 key (path) for the file
@@ -63,6 +83,7 @@ class S3Client:
                 self._bucket,
                 s3_key,
                 ExtraArgs=extra_args if extra_args else None,
+                Config=_TRANSFER_CONFIG,
             )
             logger.info(f"Uploaded file to s3://{self._bucket}/{s3_key}")
             return f"s3://{self._bucket}/{s3_key}"
@@ -97,15 +118,14 @@ class S3Client:
 
     async def upload_json(self, data: dict, s3_key: str) -> str:
         """Upload JSON data to S3."""
-        json_bytes = json.dumps(data, indent=2, default=str).encode('utf-8')
+        json_bytes = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
         return await self.upload_bytes(json_bytes, s3_key, 'application/json')
 
     async def download_file(self, s3_key: str) -> bytes:
         """Download a file from S3."""
         try:
             response = await self._run_sync(self._client.get_object, Bucket=self._bucket, Key=s3_key)
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, response['Body'].read)
+            return await self._run_sync(response['Body'].read)
         except ClientError as e:
             logger.error(f"Failed to download file: {e}")
             raise
@@ -115,6 +135,7 @@ class S3Client:
         s3_key: str,
         expiration: int = 3600,
         operation: str = 'get_object',
+        content_type: Optional[str] = None,
     ) -> str:
         """
         Generate a presigned URL for S3 object access.
@@ -123,15 +144,20 @@ class S3Client:
             s3_key: S3 key of the object
             expiration: URL expiration time in seconds
             operation: 'get_object' or 'put_object'
+            content_type: MIME type the client must send with a 'put_object' URL
 
         Returns:
             Presigned URL
         """
+        params = {'Bucket': self._bucket, 'Key': s3_key}
+        if content_type:
+            params['ContentType'] = content_type
+
         try:
             url = await self._run_sync(
                 self._client.generate_presigned_url,
                 operation,
-                Params={'Bucket': self._bucket, 'Key': s3_key},
+                Params=params,
                 ExpiresIn=expiration,
             )
             return url
@@ -149,6 +175,34 @@ class S3Client:
             logger.error(f"Failed to delete file: {e}")
             return False
 
+    async def delete_objects(self, s3_keys: List[str]) -> int:
+        """
+        Delete many files from S3 with batched DeleteObjects calls.
+
+        Returns:
+            Number of objects deleted
+        """
+        deleted = 0
+        for i in range(0, len(s3_keys), _DELETE_BATCH_LIMIT):
+            batch = s3_keys[i:i + _DELETE_BATCH_LIMIT]
+            try:
+                response = await self._run_sync(
+                    self._client.delete_objects,
+                    Bucket=self._bucket,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
+                )
+            except ClientError as e:
+                logger.error(f"Failed to delete files: {e}")
+                continue
+
+            errors = response.get('Errors', [])
+            for error in errors:
+                logger.error(f"Failed to delete s3://{self._bucket}/{error['Key']}: {error.get('Message')}")
+            deleted += len(batch) - len(errors)
+
+        logger.info(f"Deleted {deleted} objects from s3://{self._bucket}")
+        return deleted
+
     async def list_files(self, prefix: str) -> list:
         """List files in S3 with given prefix."""
         try:
@@ -0,0 +1,33 @@
+"""boto3 Session shared by the AWS client wrappers."""
+
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from config.settings import AWSSettings
+
+# Adaptive retries absorb throttling when many documents/sessions burst
+# requests at once, instead of surfacing it as a failed item. Clients with
+# extra needs merge their overrides on top.
+CLIENT_CONFIG = BotoConfig(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+
+@lru_cache(maxsize=1)
+def get_session(settings: AWSSettings) -> boto3.Session:
+    """
+    Return the process-wide boto3 Session for these settings.
+
+    Clients built from one Session share its credential resolver and
+    endpoint/model caches instead of each bootstrapping its own via the
+    implicit boto3.client() default session.
+    """
+    return boto3.Session(
+        region_name=settings.region,
+        aws_access_key_id=settings.access_key_id,
+        aws_secret_access_key=settings.secret_access_key,
+    )
@@ -1,12 +1,12 @@
 """AWS Textract client for PDF text extraction."""
 
-import boto3
 from typing import Optional
-from functools import partial
 import asyncio
 import logging
 
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +16,14 @@ class TextractClient:
 
     def __init__(self, settings: AWSSettings):
         self._settings = settings
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             'textract',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            config=CLIENT_CONFIG,
         )
 
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous boto3 call in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await run_sync(func, *args, **kwargs)
 
     async def extract_text_from_s3(
         self,
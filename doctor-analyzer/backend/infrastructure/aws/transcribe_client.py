@@ -1,14 +1,16 @@
 """AWS Transcribe client for audio transcription."""
 
-import boto3
 from typing import List, Optional
-from functools import partial
 from urllib.parse import urlparse
 import asyncio
 import logging
-import json
+
+import orjson
+from botocore.config import Config as BotoConfig
 
 from config.settings import AWSSettings
+from infrastructure.aws.executor import run_sync
+from infrastructure.aws.session import CLIENT_CONFIG, get_session
 from domain.analysis import TranscriptionSegment
 
 logger = logging.getLogger(__name__)
@@ -19,23 +21,23 @@ class TranscribeClient:
 
     def __init__(self, settings: AWSSettings):
         self._settings = settings
-        self._client = boto3.client(
+        self._client = get_session(settings).client(
             'transcribe',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            config=CLIENT_CONFIG,
         )
-        self._s3_client = boto3.client(
+        # Transcript reads run on the shared AWS executor; size the pool like
+        # S3Client's so they don't queue behind botocore's default of 10
+        self._s3_client = get_session(settings).client(
             's3',
-            region_name=settings.region,
-            aws_access_key_id=settings.access_key_id,
-            aws_secret_access_key=settings.secret_access_key,
+            config=CLIENT_CONFIG.merge(BotoConfig(
+                max_pool_connections=settings.s3_max_pool_connections,
+                tcp_keepalive=True,
+            )),
         )
 
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous boto3 call in a thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await run_sync(func, *args, **kwargs)
 
     async def start_transcription_job(
         self,
@@ -93,23 +95,33 @@ class TranscribeClient:
     async def wait_for_transcription(
         self,
         job_name: str,
-        poll_interval: float = 5.0,
+        poll_interval: float = 2.0,
         max_wait: float = 600.0,
+        max_poll_interval: float = 15.0,
+        backoff: float = 1.5,
     ) -> List[TranscriptionSegment]:
         """
         Wait for transcription job to complete and return segments.
 
+        Polls with exponential backoff: short jobs are picked up quickly,
+        while long jobs settle at one status call every `max_poll_interval`
+        seconds instead of hammering the control plane.
+
         Args:
             job_name: Transcription job name
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds before the second status check
             max_wait: Maximum seconds to wait
+            max_poll_interval: Upper bound for the delay between checks
+            backoff: Factor the delay grows by after each check
 
         Returns:
             List of transcription segments
         """
-        elapsed = 0.0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = poll_interval
 
-        while elapsed < max_wait:
+        while True:
             status = await self.get_transcription_status(job_name)
 
             if status['status'] == 'COMPLETED':
@@ -119,9 +131,13 @@ class TranscribeClient:
             if status['status'] == 'FAILED':
                 raise RuntimeError(f"Transcription failed: {status['failure_reason']}")
 
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
             logger.debug(f"Transcription job {job_name} status: {status['status']}")
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * backoff, max_poll_interval)
 
         raise TimeoutError(f"Transcription job {job_name} timed out after {max_wait}s")
 
@@ -145,15 +161,18 @@ class TranscribeClient:
         raise ValueError(f"Cannot parse S3 location from URI: {uri}")
 
     async def _fetch_and_parse_transcript(self, uri: str) -> List[TranscriptionSegment]:
-        """Fetch transcript from S3 via boto3 and parse into segments."""
+        """Fetch transcript from S3 via boto3 and parse into segments.
+
+        Download, JSON decode, and segmentation all run in one executor hop so
+        no byte-level work lands on the event loop.
+        """
+        return await self._run_sync(self._download_and_parse_transcript, uri)
+
+    def _download_and_parse_transcript(self, uri: str) -> List[TranscriptionSegment]:
+        """Blocking download + parse; run via ``_run_sync``."""
         bucket, key = self._parse_s3_uri(uri)
-        response = await self._run_sync(
-            self._s3_client.get_object,
-            Bucket=bucket,
-            Key=key,
-        )
-        body = await self._run_sync(response['Body'].read)
-        data = json.loads(body)
+        response = self._s3_client.get_object(Bucket=bucket, Key=key)
+        data = orjson.loads(response['Body'].read())
 
         segments = []
         results = data.get('results', {})
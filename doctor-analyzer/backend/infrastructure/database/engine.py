@@ -1,18 +1,42 @@
 """Async SQLAlchemy engine and session factory."""
 
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Optional
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+import orjson
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 _engine: Optional[AsyncEngine] = None
 _session_factory: Optional[async_sessionmaker] = None
 
+# Session shared by every repository call inside a session_scope().
+current_session: ContextVar[Optional[AsyncSession]] = ContextVar("db_session", default=None)
+
+# AsyncSession.info key for callbacks deferred until the scope commits
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson (dialect expects ``str``)."""
+    return orjson.dumps(value).decode("utf-8")
+
 
 def get_engine(database_url: str) -> AsyncEngine:
     """Get or create the async engine singleton."""
     global _engine, _session_factory
     if _engine is None:
-        _engine = create_async_engine(database_url, echo=False)
+        _engine = create_async_engine(
+            database_url,
+            echo=False,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+        )
         _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
     return _engine
 
@@ -31,3 +55,66 @@ async def dispose_engine() -> None:
         await _engine.dispose()
         _engine = None
         _session_factory = None
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Share one session (and one commit) across repository calls in this context.
+
+    Nested scopes reuse the outer session. The transaction is committed when
+    the outermost scope exits cleanly and rolled back on error.
+    """
+    existing = current_session.get()
+    if existing is not None:
+        yield existing
+        return
+
+    factory = get_session_factory()
+    async with factory() as db:
+        token = current_session.set(db)
+        try:
+            yield db
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+        finally:
+            current_session.reset(token)
+            callbacks = db.info.pop(_AFTER_COMMIT_KEY, [])
+        for callback in callbacks:
+            callback()
+
+
+@asynccontextmanager
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """Yield the scoped session if one is active, otherwise a fresh one."""
+    scoped = current_session.get()
+    if scoped is not None:
+        yield scoped
+        return
+
+    factory = get_session_factory()
+    async with factory() as db:
+        yield db
+
+
+async def commit(db: AsyncSession) -> None:
+    """Commit ``db``, or only flush it when an enclosing session_scope() owns the commit."""
+    if current_session.get() is db:
+        await db.flush()
+    else:
+        await db.commit()
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once ``db``'s changes are committed.
+
+    Inside a session_scope() it is deferred until the outermost scope commits
+    and dropped if the scope rolls back; otherwise ``db`` owns no pending
+    transaction (its writes were committed by commit()) and it runs
+    immediately.
+    """
+    if current_session.get() is db:
+        db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+    else:
+        callback()
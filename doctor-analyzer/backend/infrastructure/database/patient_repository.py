@@ -1,20 +1,34 @@
 """PostgreSQL patient repository."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 import uuid
 
+from cachetools import TTLCache
 from sqlalchemy import select
 
 from domain.patient import Patient
-from infrastructure.database.engine import get_session_factory
+from infrastructure.database.engine import after_commit, commit, db_session
 from infrastructure.database.models import PatientModel
 
+# Patient lookups sit on the upload/session authorization path; a short TTL
+# keeps repeat checks in-process without serving stale rows for long.
+_CACHE_MAXSIZE = 10_000
+_CACHE_TTL_SECONDS = 30
+
+# Rows fetched per round-trip when streaming the patient list
+_STREAM_BATCH_SIZE = 500
+_LIST_COLUMNS = (PatientModel.id, PatientModel.codename, PatientModel.created_at)
+
 
 class PatientRepository:
     """CRUD operations for patients in PostgreSQL."""
 
+    def __init__(self):
+        # patient_id -> Patient; only found rows are cached
+        self._cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+
     @staticmethod
-    def _to_domain(row: PatientModel) -> Patient:
+    def _to_domain(row) -> Patient:
         return Patient(
             id=str(row.id),
             codename=row.codename,
@@ -22,44 +36,62 @@ class PatientRepository:
         )
 
     async def create(self, patient: Patient) -> Patient:
-        factory = get_session_factory()
-        async with factory() as db:
+        async with db_session() as db:
             model = PatientModel(
                 id=uuid.UUID(patient.id),
                 codename=patient.codename,
                 created_at=patient.created_at,
             )
             db.add(model)
-            await db.commit()
+            await commit(db)
             await db.refresh(model)
-            return self._to_domain(model)
+            created = self._to_domain(model)
+            # Cache only once the row is committed, so a rolled-back request
+            # cannot leave a patient that does not exist in the cache
+            after_commit(db, lambda: self._cache.update({created.id: created}))
+        return created
 
     async def get(self, patient_id: str) -> Optional[Patient]:
-        factory = get_session_factory()
-        async with factory() as db:
+        cached = self._cache.get(patient_id)
+        if cached is not None:
+            return cached
+        async with db_session() as db:
             row = await db.get(PatientModel, uuid.UUID(patient_id))
-            return self._to_domain(row) if row else None
+            if row is None:
+                return None
+            patient = self._to_domain(row)
+            # Inside a request scope the row may be uncommitted (or created
+            # earlier in the same transaction); cache it only once committed
+            after_commit(db, lambda: self._cache.update({patient_id: patient}))
+        return patient
 
     async def exists(self, patient_id: str) -> bool:
-        factory = get_session_factory()
-        async with factory() as db:
-            row = await db.get(PatientModel, uuid.UUID(patient_id))
-            return row is not None
+        return await self.get(patient_id) is not None
+
+    async def iter_all(self) -> AsyncIterator[Patient]:
+        """Stream patients, newest first, through a server-side cursor."""
+        stmt = (
+            select(*_LIST_COLUMNS)
+            .order_by(PatientModel.created_at.desc())
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        async with db_session() as db:
+            result = await db.stream(stmt)
+            async for partition in result.partitions():
+                for row in partition:
+                    yield self._to_domain(row)
 
     async def list_all(self) -> List[Patient]:
-        factory = get_session_factory()
-        async with factory() as db:
-            result = await db.execute(
-                select(PatientModel).order_by(PatientModel.created_at.desc())
-            )
-            return [self._to_domain(r) for r in result.scalars().all()]
+        return [p async for p in self.iter_all()]
 
     async def delete(self, patient_id: str) -> bool:
-        factory = get_session_factory()
-        async with factory() as db:
+        self._cache.pop(patient_id, None)
+        async with db_session() as db:
             row = await db.get(PatientModel, uuid.UUID(patient_id))
             if row is None:
                 return False
             await db.delete(row)
-            await db.commit()
+            await commit(db)
+            # A lookup racing the delete may have re-cached the row
+            after_commit(db, lambda: self._cache.pop(patient_id, None))
             return True
@@ -1,16 +1,34 @@
 """PostgreSQL session store implementation."""
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import select, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from domain.analysis import AnalysisStatus, ClinicalIndicator, InjuryCheckResult
-from domain.session import AnalysisSession, SessionStoreProtocol
-from infrastructure.database.engine import get_session_factory
+from domain.session import AnalysisSession, AnalysisSessionSummary, SessionStoreProtocol
+from infrastructure.database.engine import commit, db_session
 from infrastructure.database.models import AnalysisSessionModel
 
+# Rows fetched per server-side cursor round-trip when streaming list queries.
+_STREAM_BATCH_SIZE = 500
+
+# List queries select plain columns (Core rows, no ORM identity map); the
+# converters below read them by attribute name, same as on a model instance.
+_FULL_COLUMNS = tuple(AnalysisSessionModel.__table__.c)
+
+# Columns needed by list views; skips the JSONB payloads (and their TOAST reads).
+_LIST_COLUMNS = (
+    AnalysisSessionModel.session_id,
+    AnalysisSessionModel.patient_id,
+    AnalysisSessionModel.created_at,
+    AnalysisSessionModel.updated_at,
+    AnalysisSessionModel.status,
+    AnalysisSessionModel.error_message,
+)
+
 
 class PostgresSessionStore(SessionStoreProtocol):
     """Persists sessions to PostgreSQL."""
@@ -18,7 +36,7 @@ class PostgresSessionStore(SessionStoreProtocol):
     # ── helpers ──────────────────────────────────────────────
 
     @staticmethod
-    def _to_domain(row: AnalysisSessionModel) -> AnalysisSession:
+    def _to_domain(row) -> AnalysisSession:
         injury_check = None
         if row.injury_check:
             d = row.injury_check
@@ -43,7 +61,13 @@ class PostgresSessionStore(SessionStoreProtocol):
             results_s3_key=row.results_s3_key,
             emotion_summary=row.emotion_summary or {},
             clinical_indicators=[
-                ClinicalIndicator(**ci) for ci in (row.clinical_indicators or [])
+                ClinicalIndicator(
+                    indicator_type=ci["indicator_type"],
+                    confidence=ci["confidence"],
+                    evidence=tuple(ci.get("evidence", ())),
+                    timestamp_ranges=tuple(ci.get("timestamp_ranges", ())),
+                )
+                for ci in (row.clinical_indicators or [])
             ],
             error_message=row.error_message,
             injury_check=injury_check,
@@ -53,83 +77,119 @@ class PostgresSessionStore(SessionStoreProtocol):
         )
 
     @staticmethod
-    def _to_model(session: AnalysisSession) -> AnalysisSessionModel:
-        return AnalysisSessionModel(
-            session_id=uuid.UUID(session.session_id),
-            patient_id=uuid.UUID(session.patient_id),
-            created_at=session.created_at,
-            updated_at=session.updated_at,
-            status=session.status.value if isinstance(session.status, AnalysisStatus) else session.status,
-            video_s3_key=session.video_s3_key,
-            results_s3_key=session.results_s3_key,
-            emotion_summary=session.emotion_summary or {},
-            clinical_indicators=[ci.to_dict() for ci in session.clinical_indicators],
-            injury_check=session.injury_check.to_dict() if session.injury_check else None,
-            bedrock_aggregation=session.bedrock_aggregation,
-            error_message=session.error_message,
+    def _to_summary(row) -> AnalysisSessionSummary:
+        return AnalysisSessionSummary(
+            session_id=str(row.session_id),
+            patient_id=str(row.patient_id),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            status=AnalysisStatus(row.status),
+            error_message=row.error_message,
         )
 
+    @staticmethod
+    def _to_values(session: AnalysisSession) -> dict:
+        """Column values for an INSERT/UPDATE of ``session`` (excluding the key)."""
+        return {
+            "patient_id": uuid.UUID(session.patient_id),
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
+            "status": session.status.value if isinstance(session.status, AnalysisStatus) else session.status,
+            "video_s3_key": session.video_s3_key,
+            "results_s3_key": session.results_s3_key,
+            "emotion_summary": session.emotion_summary or {},
+            "clinical_indicators": [ci.to_dict() for ci in session.clinical_indicators],
+            "injury_check": session.injury_check.to_dict() if session.injury_check else None,
+            "bedrock_aggregation": session.bedrock_aggregation,
+            "error_message": session.error_message,
+        }
+
     # ── interface ────────────────────────────────────────────
 
     async def create(self, session: AnalysisSession) -> AnalysisSession:
-        factory = get_session_factory()
-        async with factory() as db:
-            model = self._to_model(session)
-            db.add(model)
-            await db.commit()
-            await db.refresh(model)
-            return self._to_domain(model)
+        values = self._to_values(session)
+        insert_stmt = pg_insert(AnalysisSessionModel).values(
+            session_id=uuid.UUID(session.session_id), **values,
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_={col: insert_stmt.excluded[col] for col in values},
+        ).returning(AnalysisSessionModel)
+        async with db_session() as db:
+            row = (await db.scalars(stmt)).one()
+            await commit(db)
+            return self._to_domain(row)
 
     async def get(self, session_id: str) -> Optional[AnalysisSession]:
-        factory = get_session_factory()
-        async with factory() as db:
+        async with db_session() as db:
             row = await db.get(AnalysisSessionModel, uuid.UUID(session_id))
             return self._to_domain(row) if row else None
 
     async def update(self, session: AnalysisSession) -> AnalysisSession:
-        factory = get_session_factory()
-        async with factory() as db:
-            row = await db.get(AnalysisSessionModel, uuid.UUID(session.session_id))
+        values = self._to_values(session)
+        del values["created_at"]
+        values["updated_at"] = datetime.now(timezone.utc)
+        stmt = (
+            sa_update(AnalysisSessionModel)
+            .where(AnalysisSessionModel.session_id == uuid.UUID(session.session_id))
+            .values(**values)
+            .returning(AnalysisSessionModel)
+            .execution_options(synchronize_session=False)
+        )
+        async with db_session() as db:
+            row = (await db.scalars(stmt)).one_or_none()
             if row is None:
                 raise ValueError(f"Session {session.session_id} not found")
-            row.patient_id = uuid.UUID(session.patient_id)
-            row.status = session.status.value if isinstance(session.status, AnalysisStatus) else session.status
-            row.updated_at = datetime.now(timezone.utc)
-            row.video_s3_key = session.video_s3_key
-            row.results_s3_key = session.results_s3_key
-            row.emotion_summary = session.emotion_summary or {}
-            row.clinical_indicators = [ci.to_dict() for ci in session.clinical_indicators]
-            row.injury_check = session.injury_check.to_dict() if session.injury_check else None
-            row.bedrock_aggregation = session.bedrock_aggregation
-            row.error_message = session.error_message
-            await db.commit()
-            await db.refresh(row)
+            await commit(db)
             return self._to_domain(row)
 
     async def delete(self, session_id: str) -> bool:
-        factory = get_session_factory()
-        async with factory() as db:
+        async with db_session() as db:
             row = await db.get(AnalysisSessionModel, uuid.UUID(session_id))
             if row is None:
                 return False
             await db.delete(row)
-            await db.commit()
+            await commit(db)
             return True
 
+    async def iter_all(self) -> AsyncIterator[AnalysisSession]:
+        stmt = select(*_FULL_COLUMNS).order_by(AnalysisSessionModel.created_at.desc())
+        async for session in self._stream(stmt):
+            yield session
+
+    async def iter_by_patient(self, patient_id: str) -> AsyncIterator[AnalysisSession]:
+        stmt = (
+            select(*_FULL_COLUMNS)
+            .where(AnalysisSessionModel.patient_id == uuid.UUID(patient_id))
+            .order_by(AnalysisSessionModel.created_at.desc())
+        )
+        async for session in self._stream(stmt):
+            yield session
+
     async def list_all(self) -> List[AnalysisSession]:
-        factory = get_session_factory()
-        async with factory() as db:
-            result = await db.execute(
-                select(AnalysisSessionModel).order_by(AnalysisSessionModel.created_at.desc())
-            )
-            return [self._to_domain(r) for r in result.scalars().all()]
+        return [s async for s in self.iter_all()]
 
     async def list_by_patient(self, patient_id: str) -> List[AnalysisSession]:
-        factory = get_session_factory()
-        async with factory() as db:
-            result = await db.execute(
-                select(AnalysisSessionModel)
-                .where(AnalysisSessionModel.patient_id == uuid.UUID(patient_id))
-                .order_by(AnalysisSessionModel.created_at.desc())
+        return [s async for s in self.iter_by_patient(patient_id)]
+
+    async def list_summaries(
+        self, patient_id: Optional[str] = None,
+    ) -> List[AnalysisSessionSummary]:
+        stmt = (
+            select(*_LIST_COLUMNS)
+            .order_by(AnalysisSessionModel.created_at.desc())
+        )
+        if patient_id:
+            stmt = stmt.where(AnalysisSessionModel.patient_id == uuid.UUID(patient_id))
+        return [s async for s in self._stream(stmt, self._to_summary)]
+
+    async def _stream(self, stmt, convert=None) -> AsyncIterator:
+        """Stream Core rows through a server-side cursor, one partition at a time."""
+        convert = convert or self._to_domain
+        async with db_session() as db:
+            result = await db.stream(
+                stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)
             )
-            return [self._to_domain(r) for r in result.scalars().all()]
+            async for partition in result.partitions():
+                for row in partition:
+                    yield convert(row)
@@ -1,55 +1,88 @@
 """WebSocket connection management for real-time streaming."""
 
-from typing import Dict, Set, List
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from fastapi import WebSocket
 import asyncio
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Segments per transcription_batch frame; bounds the size of a single message.
+TRANSCRIPTION_BATCH_SIZE = 50
+
+# Face detections per emotion_batch frame.
+EMOTION_BATCH_SIZE = 32
+
+# Seconds between flushes of coalesced status updates (see queue_status_update).
+STATUS_FLUSH_INTERVAL = 0.1
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for analysis streaming."""
+    """Manages WebSocket connections for analysis streaming.
+
+    All mutation happens on the single asyncio event loop and never spans an
+    ``await``, so no lock is needed: each session's connections live in an
+    immutable tuple that is swapped wholesale on connect/disconnect, and
+    broadcasts iterate over whichever tuple was current when they started.
+    """
 
     def __init__(self):
-        # session_id -> set of websockets
-        self._connections: Dict[str, Set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
+        # session_id -> tuple of websockets
+        self._connections: Dict[str, Tuple[WebSocket, ...]] = {}
+        # session_id -> latest queued status payload, sent by the flusher task
+        self._pending_status: Dict[str, dict] = {}
+        self._status_flusher: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket, session_id: str) -> None:
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        async with self._lock:
-            if session_id not in self._connections:
-                self._connections[session_id] = set()
-            self._connections[session_id].add(websocket)
+        self._connections[session_id] = self._connections.get(session_id, ()) + (websocket,)
         logger.info(f"WebSocket connected for session {session_id}")
 
     async def disconnect(self, websocket: WebSocket, session_id: str) -> None:
         """Remove a WebSocket connection."""
-        async with self._lock:
-            if session_id in self._connections:
-                self._connections[session_id].discard(websocket)
-                if not self._connections[session_id]:
-                    del self._connections[session_id]
+        remaining = tuple(
+            ws for ws in self._connections.get(session_id, ()) if ws is not websocket
+        )
+        if remaining:
+            self._connections[session_id] = remaining
+        else:
+            self._connections.pop(session_id, None)
         logger.info(f"WebSocket disconnected for session {session_id}")
 
     async def broadcast_to_session(self, session_id: str, message: dict) -> None:
-        """Broadcast message to all connections for a session."""
-        async with self._lock:
-            connections = self._connections.get(session_id, set()).copy()
-
-        disconnected = []
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send to websocket: {e}")
-                disconnected.append(websocket)
+        """Broadcast message to all connections for a session.
+
+        The message is serialized once and the same text frame is sent to
+        every connection.
+        """
+        await self.broadcast_text_to_session(session_id, orjson.dumps(message).decode())
+
+    async def broadcast_text_to_session(self, session_id: str, text: str) -> None:
+        """Broadcast an already-serialized JSON message to all connections for a session."""
+        await self._broadcast(session_id, lambda websocket: websocket.send_text(text))
+
+    async def _broadcast(
+        self,
+        session_id: str,
+        send: Callable[[WebSocket], Awaitable[None]],
+    ) -> None:
+        connections = self._connections.get(session_id)
+        if not connections:
+            return
+
+        results = await asyncio.gather(
+            *(send(websocket) for websocket in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected
-        for ws in disconnected:
-            await self.disconnect(ws, session_id)
+        for websocket, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send to websocket: {result}")
+                await self.disconnect(websocket, session_id)
 
     async def send_emotion_update(
         self,
@@ -59,6 +92,8 @@ class ConnectionManager:
         bounding_box: dict,
     ) -> None:
         """Send real-time emotion detection update."""
+        if not self.has_connections(session_id):
+            return
         await self.broadcast_to_session(session_id, {
             "type": "emotion_update",
             "timestamp_ms": timestamp_ms,
@@ -66,6 +101,23 @@ class ConnectionManager:
             "bounding_box": bounding_box,
         })
 
+    async def send_emotion_batch(
+        self,
+        session_id: str,
+        detections: List[dict],
+    ) -> None:
+        """Send several emotion detections in one frame.
+
+        Each detection dict carries ``timestamp_ms``, ``emotions`` and
+        ``bounding_box``, as in an ``emotion_update`` message.
+        """
+        if not detections or not self.has_connections(session_id):
+            return
+        await self.broadcast_to_session(session_id, {
+            "type": "emotion_batch",
+            "detections": detections,
+        })
+
     async def send_status_update(
         self,
         session_id: str,
@@ -74,12 +126,50 @@ class ConnectionManager:
         message: str = None,
     ) -> None:
         """Send analysis status update."""
+        # A direct update supersedes anything still queued for the session
+        self._pending_status.pop(session_id, None)
+        if not self.has_connections(session_id):
+            return
+        await self.broadcast_to_session(
+            session_id, self._status_payload(status, progress, message)
+        )
+
+    def queue_status_update(
+        self,
+        session_id: str,
+        status: str,
+        progress: float = None,
+        message: str = None,
+    ) -> None:
+        """Queue a status update, coalescing bursts.
+
+        Only the latest queued update per session is sent, at most once per
+        STATUS_FLUSH_INTERVAL. Use for high-frequency progress; send final
+        states with ``send_status_update``, which also drops anything queued.
+        """
+        if not self.has_connections(session_id):
+            return
+        self._pending_status[session_id] = self._status_payload(status, progress, message)
+        if self._status_flusher is None or self._status_flusher.done():
+            self._status_flusher = asyncio.create_task(self._flush_status_updates())
+
+    async def _flush_status_updates(self) -> None:
+        while self._pending_status:
+            await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+            pending, self._pending_status = self._pending_status, {}
+            await asyncio.gather(*(
+                self.broadcast_to_session(session_id, payload)
+                for session_id, payload in pending.items()
+            ))
+
+    @staticmethod
+    def _status_payload(status: str, progress: Optional[float], message: Optional[str]) -> dict:
         payload = {"type": "status_update", "status": status}
         if progress is not None:
             payload["progress"] = progress
         if message is not None:
             payload["message"] = message
-        await self.broadcast_to_session(session_id, payload)
+        return payload
 
     async def send_transcription_update(
         self,
@@ -89,6 +179,8 @@ class ConnectionManager:
         end_time: float,
     ) -> None:
         """Send transcription segment update."""
+        if not self.has_connections(session_id):
+            return
         await self.broadcast_to_session(session_id, {
             "type": "transcription_update",
             "text": text,
@@ -96,15 +188,49 @@ class ConnectionManager:
             "end_time": end_time,
         })
 
+    async def send_transcription_batch(
+        self,
+        session_id: str,
+        segments: List[dict],
+    ) -> None:
+        """Send transcription segments coalesced into a few frames.
+
+        Each segment dict carries ``text``, ``start_time`` and ``end_time``.
+        Yields to the event loop between frames so a long transcript does not
+        monopolize it while socket buffers drain.
+        """
+        if not self.has_connections(session_id):
+            return
+        for start in range(0, len(segments), TRANSCRIPTION_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            await self.broadcast_to_session(session_id, {
+                "type": "transcription_batch",
+                "segments": segments[start:start + TRANSCRIPTION_BATCH_SIZE],
+            })
+
     async def send_complete(self, session_id: str, results: dict) -> None:
         """Send analysis completion message."""
+        if not self.has_connections(session_id):
+            return
         await self.broadcast_to_session(session_id, {
             "type": "complete",
             "results": results,
         })
 
+    async def send_complete_raw(self, session_id: str, results_json: bytes) -> None:
+        """Send analysis completion message with results already serialized to JSON."""
+        if not self.has_connections(session_id):
+            return
+        await self.broadcast_text_to_session(
+            session_id,
+            '{"type":"complete","results":' + results_json.decode("utf-8") + "}",
+        )
+
     async def send_error(self, session_id: str, message: str) -> None:
         """Send error message."""
+        if not self.has_connections(session_id):
+            return
         await self.broadcast_to_session(session_id, {
             "type": "error",
             "message": message,
@@ -112,8 +238,8 @@ class ConnectionManager:
 
     def get_connection_count(self, session_id: str) -> int:
         """Get number of connections for a session."""
-        return len(self._connections.get(session_id, set()))
+        return len(self._connections.get(session_id, ()))
 
     def has_connections(self, session_id: str) -> bool:
         """Check if session has any active connections."""
-        return session_id in self._connections and len(self._connections[session_id]) > 0
+        return bool(self._connections.get(session_id))
@@ -2,6 +2,7 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 
 from config.settings import get_settings
@@ -27,7 +28,7 @@ app = FastAPI(
 settings = get_settings()
 
 # Configure CORS
-origins = settings.cors_origins.split(",")
+origins = tuple(origin.strip() for origin in settings.cors_origins.split(","))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -43,26 +44,30 @@ app.include_router(sessions.router, prefix="/api")
 app.include_router(patients.router, prefix="/api")
 app.include_router(analysis_ws.router)
 
+# Static response bodies, built once at import time
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "app_name": settings.app_name,
+    "debug": settings.debug,
+}
+_ROOT_PAYLOAD = {
+    "name": "Doctor Analyzer API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health",
+}
+
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "app_name": settings.app_name,
-        "debug": settings.debug,
-    }
+    return _HEALTH_PAYLOAD
 
 
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": "Doctor Analyzer API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health",
-    }
+    return _ROOT_PAYLOAD
 
 
 @app.on_event("startup")
@@ -71,6 +76,7 @@ async def startup_event():
     logger.info(f"Starting {settings.app_name}")
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"CORS origins: {settings.cors_origins}")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     get_engine(settings.database.url)
     logger.info("Database engine initialized")
 
@@ -1,7 +1,11 @@
 """Service for aggregating analysis results."""
 
+import asyncio
 import logging
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, Sequence
+
+import orjson
 
 from infrastructure.aws.s3_client import S3Client
 from infrastructure.websocket.connection_manager import ConnectionManager
@@ -10,6 +14,30 @@ from domain.analysis import ClinicalIndicator, AnalysisStatus
 
 logger = logging.getLogger(__name__)
 
+# Average emotion score at or above which an emotion becomes a clinical indicator
+_EMOTION_THRESHOLDS = (
+    ('discomfort', 0.3),
+    ('depression', 0.3),
+    ('anxiety', 0.3),
+    ('fear', 0.4),
+)
+
+# Evidence templates, %-formatted with a percentage (score * 100)
+_EMOTION_EVIDENCE_TEMPLATES = {
+    indicator_type: f"Average {indicator_type} score: %.2f%%"
+    for indicator_type, _ in _EMOTION_THRESHOLDS
+}
+_EVIDENCE_NEGATIVE = "Negative sentiment in %s: %.2f%%"
+_EVIDENCE_MIXED = "Mixed sentiment in %s: %.2f%%"
+
+# Sentiment scores above which distress / uncertainty indicators are raised
+_DISTRESS_THRESHOLD = 0.5
+_UNCERTAINTY_THRESHOLD = 0.4
+_NO_INDICATORS: Sequence[ClinicalIndicator] = ()
+
+# Caps concurrent final-report uploads across all sessions
+_REPORT_UPLOAD_LIMIT = asyncio.Semaphore(16)
+
 
 class AggregationService:
     """Aggregates all analysis results and generates clinical indicators."""
@@ -58,21 +86,28 @@ class AggregationService:
             message="Saving final report...",
         )
 
-        # Save final report to S3
-        final_report = session.to_full_dict()
-        results_key = f"sessions/{session.session_id}/results/final_report.json"
-        await self._s3.upload_json(final_report, results_key)
-        session.results_s3_key = results_key
-
-        # Update session status to completed
+        # Build and serialize the final report once; the same bytes go to S3
+        # and to WebSocket clients
+        session.results_s3_key = f"sessions/{session.session_id}/results/final_report.json"
         session.update_status(AnalysisStatus.COMPLETED)
-        await self._sessions.update(session)
+        report_json = orjson.dumps(session.to_full_dict(), default=str)
 
-        # Send completion message
-        await self._ws_manager.send_complete(
-            session.session_id,
-            session.to_full_dict(),
+        # Upload the report while the completed status is persisted and sent
+        upload_task = asyncio.create_task(
+            self._upload_report(report_json, session.results_s3_key)
         )
+        try:
+            await asyncio.gather(
+                self._sessions.update(session),
+                self._ws_manager.send_complete_raw(session.session_id, report_json),
+            )
+        finally:
+            uploaded = await upload_task
+
+        if not uploaded:
+            # Point the results endpoint back at the session data
+            session.results_s3_key = None
+            await self._sessions.update(session)
 
         await self._ws_manager.send_status_update(
             session.session_id,
@@ -83,6 +118,16 @@ class AggregationService:
         logger.info(f"Completed aggregation for session {session.session_id}")
         return session
 
+    async def _upload_report(self, report_json: bytes, results_key: str) -> bool:
+        """Upload the final report to S3. Returns False if the upload failed."""
+        async with _REPORT_UPLOAD_LIMIT:
+            try:
+                await self._s3.upload_bytes(report_json, results_key, 'application/json')
+                return True
+            except Exception as e:
+                logger.exception("Failed to upload final report %s: %s", results_key, e)
+                return False
+
     def _generate_clinical_indicators(
         self,
         session: AnalysisSession,
@@ -113,7 +158,7 @@ class AggregationService:
                 ClinicalIndicator(
                     indicator_type="potential_injury_signals",
                     confidence=session.injury_check.confidence,
-                    evidence=[f"Injury check (Rekognition): {session.injury_check.summary}"],
+                    evidence=(f"Injury check (Rekognition): {session.injury_check.summary}",),
                 )
             )
 
@@ -125,60 +170,56 @@ class AggregationService:
                     ClinicalIndicator(
                         indicator_type="bedrock_risk_assessment",
                         confidence=0.9 if risk_level == "critical" else 0.7,
-                        evidence=session.bedrock_aggregation.get("concordant_signals", []),
+                        evidence=tuple(session.bedrock_aggregation.get("concordant_signals", ())),
                     )
                 )
 
         # Sort by confidence
-        indicators.sort(key=lambda x: x.confidence, reverse=True)
+        indicators.sort(key=attrgetter('confidence'), reverse=True)
 
         return indicators
 
     def _indicators_from_emotions(self, emotion_summary: dict) -> list:
         """Extract clinical indicators from emotion summary."""
-        indicators = []
-        thresholds = {
-            'discomfort': 0.3,
-            'depression': 0.3,
-            'anxiety': 0.3,
-            'fear': 0.4,
-        }
-
-        for indicator_type, threshold in thresholds.items():
-            confidence = emotion_summary.get(indicator_type, 0)
-            if confidence >= threshold:
-                indicators.append(ClinicalIndicator(
-                    indicator_type=indicator_type,
-                    confidence=confidence,
-                    evidence=[f"Average {indicator_type} score: {confidence:.2%}"],
-                ))
-
-        return indicators
+        return [
+            ClinicalIndicator(
+                indicator_type=indicator_type,
+                confidence=confidence,
+                evidence=(_EMOTION_EVIDENCE_TEMPLATES[indicator_type] % (confidence * 100),),
+            )
+            for indicator_type, threshold in _EMOTION_THRESHOLDS
+            if (confidence := emotion_summary.get(indicator_type, 0)) >= threshold
+        ]
 
     def _indicators_from_sentiment(
         self,
         sentiment: dict,
         source: str,
-    ) -> list:
+    ) -> Sequence[ClinicalIndicator]:
         """Extract clinical indicators from sentiment analysis."""
+        negative_score = sentiment.get('negative_score', 0)
+        mixed_score = sentiment.get('mixed_score', 0)
+
+        # Common case: neither threshold is crossed
+        if negative_score <= _DISTRESS_THRESHOLD and mixed_score <= _UNCERTAINTY_THRESHOLD:
+            return _NO_INDICATORS
+
         indicators = []
 
         # High negative sentiment may indicate distress
-        negative_score = sentiment.get('negative_score', 0)
-        if negative_score > 0.5:
+        if negative_score > _DISTRESS_THRESHOLD:
             indicators.append(ClinicalIndicator(
                 indicator_type='distress',
                 confidence=negative_score,
-                evidence=[f"Negative sentiment in {source}: {negative_score:.2%}"],
+                evidence=(_EVIDENCE_NEGATIVE % (source, negative_score * 100),),
             ))
 
         # Mixed sentiment may indicate confusion or uncertainty
-        mixed_score = sentiment.get('mixed_score', 0)
-        if mixed_score > 0.4:
+        if mixed_score > _UNCERTAINTY_THRESHOLD:
             indicators.append(ClinicalIndicator(
                 indicator_type='uncertainty',
                 confidence=mixed_score,
-                evidence=[f"Mixed sentiment in {source}: {mixed_score:.2%}"],
+                evidence=(_EVIDENCE_MIXED % (source, mixed_score * 100),),
             ))
 
         return indicators
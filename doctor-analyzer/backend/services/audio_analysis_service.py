@@ -1,18 +1,25 @@
 """Service for audio extraction and analysis."""
 
+import asyncio
 import logging
 import uuid
+from typing import List
 
 from infrastructure.aws.transcribe_client import TranscribeClient
 from infrastructure.aws.comprehend_client import ComprehendClient
 from infrastructure.aws.s3_client import S3Client
 from infrastructure.websocket.connection_manager import ConnectionManager
 from domain.session import AnalysisSession, SessionStore
-from domain.analysis import AudioAnalysis, AnalysisStatus
+from domain.analysis import AudioAnalysis, AnalysisStatus, TranscriptionSegment
 
 logger = logging.getLogger(__name__)
 
 
+async def _none() -> None:
+    """Placeholder awaitable for a skipped branch of an ``asyncio.gather``."""
+    return None
+
+
 class AudioAnalysisService:
     """Orchestrates audio extraction, transcription, and sentiment analysis."""
 
@@ -86,15 +93,6 @@ class AudioAnalysisService:
             logger.error(f"Transcription failed: {e}")
             raise
 
-        # Stream transcription segments to WebSocket
-        for segment in segments:
-            await self._ws_manager.send_transcription_update(
-                session.session_id,
-                segment.text,
-                segment.start_time,
-                segment.end_time,
-            )
-
         await self._ws_manager.send_status_update(
             session.session_id,
             AnalysisStatus.PROCESSING_AUDIO.value,
@@ -105,20 +103,20 @@ class AudioAnalysisService:
         # Build AudioAnalysis result
         audio_analysis = AudioAnalysis(transcription=segments)
 
-        # Analyze sentiment of full transcript
-        if audio_analysis.full_transcript:
-            overall_sentiment = await self._comprehend.detect_sentiment(
-                audio_analysis.full_transcript
-            )
-            audio_analysis.overall_sentiment = overall_sentiment
-
-            # Analyze sentiment of individual segments for detailed analysis
-            segment_texts = [s.text for s in segments if len(s.text) > 20]
-            if segment_texts:
-                segment_sentiments = await self._comprehend.batch_detect_sentiment(
-                    segment_texts[:25]  # Limit to 25 for batch
-                )
-                audio_analysis.segment_sentiments = segment_sentiments
+        # Stream segments to WebSocket clients while Comprehend scores the
+        # full transcript and the individual segments — all independent I/O.
+        full_transcript = audio_analysis.full_transcript
+        segment_texts = [s.text for s in segments if len(s.text) > 20]
+        overall_sentiment, segment_sentiments, _ = await asyncio.gather(
+            self._comprehend.detect_sentiment(full_transcript) if full_transcript else _none(),
+            self._comprehend.batch_detect_sentiment(
+                segment_texts[:25]  # Limit to 25 for batch
+            ) if full_transcript and segment_texts else _none(),
+            self._stream_segments(session.session_id, segments),
+        )
+        audio_analysis.overall_sentiment = overall_sentiment
+        if segment_sentiments:
+            audio_analysis.segment_sentiments = [r for r in segment_sentiments if r]
 
         # Save results to S3
         results_key = f"sessions/{session.session_id}/results/transcription.json"
@@ -140,3 +138,21 @@ class AudioAnalysisService:
 
         logger.info(f"Completed audio analysis for session {session.session_id}")
         return audio_analysis
+
+    async def _stream_segments(
+        self,
+        session_id: str,
+        segments: List[TranscriptionSegment],
+    ) -> None:
+        """Send transcription segments to WebSocket clients in batched frames."""
+        await self._ws_manager.send_transcription_batch(
+            session_id,
+            [
+                {
+                    "text": segment.text,
+                    "start_time": segment.start_time,
+                    "end_time": segment.end_time,
+                }
+                for segment in segments
+            ],
+        )
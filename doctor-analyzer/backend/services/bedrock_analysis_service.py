@@ -1,6 +1,8 @@
 """Service for Bedrock-enhanced injury and clinical analysis."""
 
+import asyncio
 import logging
+from bisect import bisect_left, bisect_right
 from typing import Any, Dict, List, Optional
 
 from domain.analysis import AnalysisStatus, InjuryCheckResult
@@ -79,6 +81,33 @@ class BedrockAnalysisService:
 
         return result
 
+    async def enhance_injury_check(
+        self,
+        session: AnalysisSession,
+    ) -> Optional[InjuryCheckResult]:
+        """Run Use Cases 1 and 2 concurrently and merge them into the injury check.
+
+        The two Bedrock calls are independent (labels + transcript context vs.
+        full transcript), so they are issued together. A failure in either one
+        is logged and leaves the other's findings in place.
+        """
+        enhanced, transcript_analysis = await asyncio.gather(
+            self.enhance_injury_interpretation(session),
+            self.analyze_transcript_for_injuries(session),
+            return_exceptions=True,
+        )
+
+        if isinstance(enhanced, Exception):
+            logger.error("Bedrock label interpretation failed, keeping Rekognition results: %s", enhanced)
+            enhanced = session.injury_check
+        if isinstance(transcript_analysis, Exception):
+            logger.error("Bedrock transcript analysis failed: %s", transcript_analysis)
+            transcript_analysis = None
+
+        if enhanced is not None and transcript_analysis:
+            enhanced.transcript_analysis = transcript_analysis
+        return enhanced
+
     async def analyze_transcript_for_injuries(
         self,
         session: AnalysisSession,
@@ -185,22 +214,30 @@ class BedrockAnalysisService:
         """Extract transcript text within a time window around given timestamps.
 
         For each flagged timestamp, finds transcription segments that fall
-        within +/- window_ms and joins them.
+        within +/- window_ms and joins them in chronological order.
+
+        Segments are assumed to be chronological (as Transcribe emits them),
+        so each window maps to a contiguous index range found by binary
+        search; sorting the timestamps makes those ranges monotonic and lets
+        them be merged in a single sweep.
         """
         if not timestamps_ms or not transcription_segments:
             return ""
 
+        starts_ms = [seg.start_time * 1000 for seg in transcription_segments]
+        ends_ms = [seg.end_time * 1000 for seg in transcription_segments]
+
         relevant_texts: List[str] = []
-        seen_segments = set()
-
-        for ts in timestamps_ms:
-            lower = ts - window_ms
-            upper = ts + window_ms
-            for i, seg in enumerate(transcription_segments):
-                seg_start_ms = seg.start_time * 1000
-                seg_end_ms = seg.end_time * 1000
-                if seg_end_ms >= lower and seg_start_ms <= upper and i not in seen_segments:
-                    seen_segments.add(i)
-                    relevant_texts.append(seg.text)
-
-        return " ".join(relevant_texts) if relevant_texts else ""
+        covered_until = 0  # segments before this index were already emitted
+
+        for ts in sorted(timestamps_ms):
+            first = bisect_left(ends_ms, ts - window_ms)
+            last = bisect_right(starts_ms, ts + window_ms)
+            first = max(first, covered_until)
+            if first < last:
+                relevant_texts.extend(
+                    seg.text for seg in transcription_segments[first:last]
+                )
+                covered_until = last
+
+        return " ".join(relevant_texts)
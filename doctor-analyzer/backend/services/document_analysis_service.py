@@ -2,16 +2,34 @@
 
 import logging
 import uuid
+from typing import Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
 
 from infrastructure.aws.textract_client import TextractClient
 from infrastructure.aws.comprehend_client import ComprehendClient
 from infrastructure.aws.s3_client import S3Client
 from infrastructure.websocket.connection_manager import ConnectionManager
 from domain.session import AnalysisSession, SessionStore
-from domain.analysis import DocumentAnalysis, AnalysisStatus
+from domain.analysis import DocumentAnalysis, AnalysisStatus, SentimentResult
 
 logger = logging.getLogger(__name__)
 
+# Texts shorter than this (stripped) carry too little signal to be worth the
+# Comprehend calls; they get a neutral result instead.
+_MIN_ANALYZABLE_CHARS = 20
+_NEUTRAL_SENTIMENT = SentimentResult(
+    sentiment="NEUTRAL",
+    positive_score=0.0,
+    negative_score=0.0,
+    neutral_score=1.0,
+    mixed_score=0.0,
+)
+
+
+def _is_analyzable(text: Optional[str]) -> bool:
+    return bool(text) and len(text.strip()) >= _MIN_ANALYZABLE_CHARS
+
 
 class DocumentAnalysisService:
     """Orchestrates PDF text extraction and analysis."""
@@ -68,7 +86,7 @@ class DocumentAnalysisService:
                     self._s3.bucket_name,
                     s3_key,
                 )
-            except Exception as e:
+            except (ClientError, BotoCoreError) as e:
                 logger.error(f"Failed to extract text from {s3_key}: {e}")
                 continue
 
@@ -83,8 +101,8 @@ class DocumentAnalysisService:
                 extracted_text=extracted_text,
             )
 
-            # Analyze sentiment and key phrases if we have text
-            if extracted_text:
+            # Analyze sentiment and key phrases if we have enough text
+            if _is_analyzable(extracted_text):
                 # Detect language first
                 language = await self._comprehend.detect_dominant_language(extracted_text)
 
@@ -120,7 +138,7 @@ class DocumentAnalysisService:
 
             # Update progress
             progress = (i + 1) / total_docs
-            await self._ws_manager.send_status_update(
+            self._ws_manager.queue_status_update(
                 session.session_id,
                 AnalysisStatus.PROCESSING_DOCUMENTS.value,
                 progress=progress,
@@ -158,17 +176,22 @@ class DocumentAnalysisService:
 
         text = session.text_input
 
-        # Detect language
-        language = await self._comprehend.detect_dominant_language(text)
+        if not _is_analyzable(text):
+            # Too short to be worth Comprehend; still persisted and broadcast
+            sentiment = _NEUTRAL_SENTIMENT
+            key_phrases, entities = [], []
+        else:
+            # Detect language
+            language = await self._comprehend.detect_dominant_language(text)
 
-        # Sentiment analysis
-        sentiment = await self._comprehend.detect_sentiment(text, language_code=language)
+            # Sentiment analysis
+            sentiment = await self._comprehend.detect_sentiment(text, language_code=language)
 
-        # Key phrases
-        key_phrases = await self._comprehend.detect_key_phrases(text, language_code=language)
+            # Key phrases
+            key_phrases = await self._comprehend.detect_key_phrases(text, language_code=language)
 
-        # Entities (medical terms, etc.)
-        entities = await self._comprehend.detect_entities(text, language_code=language)
+            # Entities (medical terms, etc.)
+            entities = await self._comprehend.detect_entities(text, language_code=language)
 
         result = {
             "sentiment": sentiment.to_dict(),
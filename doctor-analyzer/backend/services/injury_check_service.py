@@ -1,7 +1,9 @@
 """Service for optional injury check using Rekognition content moderation only (no Bedrock)."""
 
 import logging
-from typing import List, Dict, Any, Tuple
+import re
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from domain.session import AnalysisSession
 from domain.analysis import InjuryCheckResult, AnalysisStatus
@@ -27,26 +29,45 @@ INJURY_RELATED_KEYWORDS = (
 )
 CONFIDENCE_THRESHOLD = 0.5  # minimum confidence to consider a label as a signal
 
+# Single compiled alternation: one C-level scan per label instead of a Python
+# loop over every keyword
+_INJURY_KEYWORD_PATTERN = re.compile(
+    "|".join(map(re.escape, INJURY_RELATED_KEYWORDS)),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=512)
+def _is_injury_related(name: str) -> bool:
+    # Rekognition repeats the same few label names across frames, so each
+    # distinct name is scanned once.
+    return _INJURY_KEYWORD_PATTERN.search(name) is not None
+
 
-def _interpret_labels(labels: List[Dict[str, Any]]) -> Tuple[bool, str, float]:
+def _match_label(label: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+    """Return (name, confidence) if the label is a confident injury-related signal."""
+    confidence = label.get("confidence", 0)
+    if confidence < CONFIDENCE_THRESHOLD:
+        return None
+    name = label.get("name") or ""
+    if _is_injury_related(name):
+        return name, confidence
+    return None
+
+
+def _summarize_matches(
+    relevant: List[Tuple[str, float]],
+    label_count: int,
+) -> Tuple[bool, str, float]:
     """
-    Derive has_signals, summary, and confidence from Rekognition moderation labels only.
+    Derive has_signals, summary, and confidence from the matched labels.
 
     Returns:
         (has_signals, summary, confidence)
     """
-    if not labels:
+    if not label_count:
         return False, "No concerning content detected.", 0.0
 
-    relevant = []
-    for lb in labels:
-        name = (lb.get("name") or "").lower()
-        confidence = lb.get("confidence", 0)
-        if confidence < CONFIDENCE_THRESHOLD:
-            continue
-        if any(kw in name for kw in INJURY_RELATED_KEYWORDS):
-            relevant.append((lb.get("name", ""), confidence))
-
     if not relevant:
         return False, "No injury or violence-related content detected.", 0.0
 
@@ -70,13 +91,34 @@ class InjuryCheckService:
         self._s3 = s3
         self._ws_manager = ws_manager
 
+    async def start_moderation_job(self, session: AnalysisSession) -> str:
+        """
+        Start the Rekognition content moderation job for the session video.
+
+        Lets the pipeline start the job early, so Rekognition processes it
+        while face detection runs; pass the result to `run_injury_check`.
+
+        Returns:
+            Rekognition job ID
+        """
+        return await self._rekognition.start_content_moderation(
+            self._s3.bucket_name,
+            session.video_s3_key,
+        )
+
     async def run_injury_check(
         self,
         session: AnalysisSession,
+        moderation_job: Optional[Awaitable[str]] = None,
     ) -> InjuryCheckResult:
         """
         Run content moderation on the session video; interpret labels for injury (Rekognition only).
 
+        Args:
+            session: Session whose video is checked
+            moderation_job: Job ID awaitable from `start_moderation_job`;
+                a new job is started when omitted
+
         On failure, returns a result with enabled=True and error_message set.
         """
         if not session.video_s3_key:
@@ -96,14 +138,19 @@ class InjuryCheckService:
             message="Running injury check (content moderation)...",
         )
 
+        # Labels are matched as each results page arrives, so interpretation
+        # overlaps with paging through Rekognition
         labels: List[Dict[str, Any]] = []
+        relevant: List[Tuple[str, float]] = []
         try:
-            job_id = await self._rekognition.start_content_moderation(
-                self._s3.bucket_name,
-                session.video_s3_key,
-            )
+            if moderation_job is None:
+                moderation_job = self.start_moderation_job(session)
+            job_id = await moderation_job
             async for label in self._rekognition.get_content_moderation_results(job_id):
                 labels.append(label)
+                match = _match_label(label)
+                if match:
+                    relevant.append(match)
         except Exception as e:
             logger.exception("Rekognition content moderation failed: %s", e)
             return InjuryCheckResult(
@@ -122,7 +169,7 @@ class InjuryCheckService:
             message="Interpreting content moderation results...",
         )
 
-        has_signals, summary, confidence = _interpret_labels(labels)
+        has_signals, summary, confidence = _summarize_matches(relevant, len(labels))
         return InjuryCheckResult(
             enabled=True,
             rekognition_labels=labels,
@@ -1,7 +1,7 @@
 """Patient business logic."""
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from domain.patient import Patient
 from infrastructure.database.patient_repository import PatientRepository
@@ -27,8 +27,12 @@ class PatientService:
     async def patient_exists(self, patient_id: str) -> bool:
         return await self._repo.exists(patient_id)
 
+    async def iter_patients(self) -> AsyncIterator[Patient]:
+        async for patient in self._repo.iter_all():
+            yield patient
+
     async def list_patients(self) -> List[Patient]:
-        return await self._repo.list_all()
+        return [p async for p in self.iter_patients()]
 
     async def delete_patient(self, patient_id: str) -> bool:
         return await self._repo.delete(patient_id)
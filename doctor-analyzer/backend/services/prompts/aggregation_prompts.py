@@ -1,8 +1,14 @@
 """Prompt templates for Bedrock multi-modal aggregation."""
 
-import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+# Inputs are serialized with sorted keys so equal inputs always render the
+# same prompt bytes, which keeps Bedrock prompt caching effective.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
 
 def build_multimodal_aggregation_prompt(
     emotion_summary: Dict[str, float],
@@ -17,13 +23,34 @@ def build_multimodal_aggregation_prompt(
     results into a unified clinical summary with cross-referenced evidence.
     """
     # Truncate transcript to fit token limits
-    truncated_transcript = transcript_text[:4000] if len(transcript_text) > 4000 else transcript_text
+    truncated_transcript = transcript_text[:4000]
+
+    emotion_json = _to_json(emotion_summary)
+    sentiment_json = _to_json(sentiment_result) if sentiment_result else "Not available"
+    injury_check_json = _to_json(injury_check_result) if injury_check_result else "Not performed"
+    indicators_json = _to_json(clinical_indicators) if clinical_indicators else "[]"
+
+    return _render_multimodal_aggregation_prompt(
+        emotion_json,
+        truncated_transcript,
+        sentiment_json,
+        injury_check_json,
+        indicators_json,
+    )
 
-    emotion_json = json.dumps(emotion_summary, indent=2)
-    sentiment_json = json.dumps(sentiment_result, indent=2) if sentiment_result else "Not available"
-    injury_check_json = json.dumps(injury_check_result, indent=2) if injury_check_result else "Not performed"
-    indicators_json = json.dumps(clinical_indicators, indent=2) if clinical_indicators else "[]"
 
+def _to_json(value: Any) -> str:
+    return orjson.dumps(value, option=_JSON_OPTIONS).decode()
+
+
+@lru_cache(maxsize=128)
+def _render_multimodal_aggregation_prompt(
+    emotion_json: str,
+    truncated_transcript: str,
+    sentiment_json: str,
+    injury_check_json: str,
+    indicators_json: str,
+) -> str:
     return f"""\
 You are a clinical psychology analysis assistant. Synthesize all available \
 analysis signals from a patient therapy session into a unified clinical summary.
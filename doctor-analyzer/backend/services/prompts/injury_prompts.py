@@ -1,8 +1,19 @@
 """Prompt templates for Bedrock-enhanced injury analysis."""
 
-import json
+import heapq
+from functools import lru_cache
 from typing import Any, Dict, List
 
+import orjson
+
+# Labels are serialized with sorted keys so equal inputs always render the
+# same prompt bytes, which keeps Bedrock prompt caching effective.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+# Long videos yield thousands of moderation labels; only the most confident
+# ones are sent to the model to bound prompt size and token cost.
+_MAX_PROMPT_LABELS = 50
+
 
 def build_label_interpretation_prompt(
     rekognition_labels: List[Dict[str, Any]],
@@ -12,10 +23,21 @@ def build_label_interpretation_prompt(
 
     Use Case 1: Takes raw Rekognition content moderation labels and the
     transcript text around the flagged timestamps, and asks the model to
-    assess genuine injury risk vs. false positives.
+    assess genuine injury risk vs. false positives. Only the
+    `_MAX_PROMPT_LABELS` most confident labels are included.
     """
-    labels_json = json.dumps(rekognition_labels, indent=2)
-
+    if len(rekognition_labels) > _MAX_PROMPT_LABELS:
+        rekognition_labels = heapq.nlargest(
+            _MAX_PROMPT_LABELS,
+            rekognition_labels,
+            key=lambda label: label.get("confidence", 0),
+        )
+    labels_json = orjson.dumps(rekognition_labels, option=_JSON_OPTIONS).decode()
+    return _render_label_interpretation_prompt(labels_json, transcript_context)
+
+
+@lru_cache(maxsize=128)
+def _render_label_interpretation_prompt(labels_json: str, transcript_context: str) -> str:
     return f"""\
 You are a clinical psychology analysis assistant reviewing content moderation \
 results from a patient therapy session video. Your task is to interpret visual \
@@ -54,6 +76,7 @@ indicating active risk.
 }}"""
 
 
+@lru_cache(maxsize=128)
 def build_transcript_analysis_prompt(full_transcript: str) -> str:
     """Build prompt for scanning transcript for verbal injury indicators.
 
@@ -62,7 +85,7 @@ def build_transcript_analysis_prompt(full_transcript: str) -> str:
     abuse, physical neglect, and accidental injury.
     """
     # Truncate to avoid exceeding token limits
-    truncated = full_transcript[:8000] if len(full_transcript) > 8000 else full_transcript
+    truncated = full_transcript[:8000]
 
     return f"""\
 You are a clinical psychology analysis assistant. Analyze the following \
@@ -1,17 +1,51 @@
 """Service for handling file uploads."""
 
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional, Tuple
 from fastapi import UploadFile
 from datetime import datetime
+import os
 import uuid
 import logging
 
+from cachetools import TTLCache
+
 from infrastructure.aws.s3_client import S3Client
 from domain.session import AnalysisSession, SessionStoreProtocol
 from domain.analysis import AnalysisStatus
 
 logger = logging.getLogger(__name__)
 
+# Playback URLs are signed for an hour and cached per session for 50 minutes,
+# so a cached URL always has at least 10 minutes of validity left. Module-level
+# because an UploadService is built per request.
+_VIDEO_URL_EXPIRATION = 3600
+_VIDEO_URL_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3000)
+
+# Session IDs are drawn from a pool refilled with one entropy read per
+# _SESSION_ID_BATCH IDs instead of a urandom syscall per uuid4()
+_SESSION_ID_BATCH = 1024
+_session_id_pool: Deque[str] = deque()
+
+
+def _next_session_id() -> str:
+    """Return a random (version 4) UUID string from the pool."""
+    if not _session_id_pool:
+        entropy = os.urandom(16 * _SESSION_ID_BATCH)
+        _session_id_pool.extend(
+            str(uuid.UUID(bytes=entropy[i:i + 16], version=4))
+            for i in range(0, len(entropy), 16)
+        )
+    return _session_id_pool.popleft()
+
+
+def _video_key(session_id: str, filename: Optional[str]) -> str:
+    """S3 key for a session's video, keeping only the base name of the client filename."""
+    name = (filename or "").replace("\\", "/").rpartition("/")[2]
+    if name in ("", ".", ".."):
+        name = "video"
+    return f"sessions/{session_id}/video/{name}"
+
 
 class UploadService:
     """Orchestrates file uploads to S3 and session management."""
@@ -26,7 +60,7 @@ class UploadService:
     ) -> AnalysisSession:
         """Create a new analysis session."""
         session = AnalysisSession(
-            session_id=str(uuid.uuid4()),
+            session_id=_next_session_id(),
             created_at=datetime.utcnow(),
             status=AnalysisStatus.PENDING,
             patient_id=patient_id,
@@ -54,7 +88,7 @@ class UploadService:
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
-        s3_key = f"sessions/{session_id}/video/{file.filename}"
+        s3_key = _video_key(session_id, file.filename)
 
         # Get content type
         content_type = file.content_type or 'video/mp4'
@@ -66,21 +100,92 @@ class UploadService:
         session.video_s3_key = s3_key
         session.update_status(AnalysisStatus.UPLOADING)
         await self._sessions.update(session)
+        _VIDEO_URL_CACHE.pop(session_id, None)
 
         logger.info(f"Uploaded video {file.filename} to {s3_key}")
         return s3_key
 
+    async def presign_video_upload(
+        self,
+        session_id: str,
+        filename: str,
+        content_type: str,
+        expiration: int = 3600,
+    ) -> Tuple[str, str]:
+        """
+        Issue a presigned PUT URL so the client uploads the video straight to S3.
+
+        The video bytes never pass through the backend. The session only
+        records the target key; `confirm_video_upload` checks the object
+        landed before analysis may start.
+
+        Args:
+            session_id: Session to attach video to
+            filename: Original file name, used for the S3 key
+            content_type: MIME type the client will send with the PUT
+            expiration: URL expiration time in seconds
+
+        Returns:
+            Tuple of (S3 key, presigned PUT URL)
+        """
+        session = await self._sessions.get(session_id)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+
+        s3_key = _video_key(session_id, filename)
+        upload_url = await self._s3.get_presigned_url(
+            s3_key,
+            expiration=expiration,
+            operation='put_object',
+            content_type=content_type,
+        )
+
+        session.video_s3_key = s3_key
+        await self._sessions.update(session)
+        _VIDEO_URL_CACHE.pop(session_id, None)
+
+        logger.info(f"Issued presigned upload URL for {s3_key}")
+        return s3_key, upload_url
+
+    async def confirm_video_upload(self, session: AnalysisSession) -> bool:
+        """
+        Mark a presigned upload as done once the object exists in S3.
+
+        Returns:
+            True if the video is in S3, False if the client has not finished the PUT
+        """
+        if not session.video_s3_key:
+            return False
+        if session.status != AnalysisStatus.PENDING:
+            return True
+
+        if not await self._s3.file_exists(session.video_s3_key):
+            return False
+
+        session.update_status(AnalysisStatus.UPLOADING)
+        await self._sessions.update(session)
+        return True
+
     async def get_session(self, session_id: str) -> Optional[AnalysisSession]:
         """Get session by ID."""
         return await self._sessions.get(session_id)
 
     async def get_video_url(self, session_id: str) -> Optional[str]:
-        """Get presigned URL for video playback."""
+        """Get presigned URL for video playback, reusing a recently signed one."""
+        url = _VIDEO_URL_CACHE.get(session_id)
+        if url is not None:
+            return url
+
         session = await self._sessions.get(session_id)
         if not session or not session.video_s3_key:
             return None
 
-        return await self._s3.get_presigned_url(session.video_s3_key)
+        url = await self._s3.get_presigned_url(
+            session.video_s3_key,
+            expiration=_VIDEO_URL_EXPIRATION,
+        )
+        _VIDEO_URL_CACHE[session_id] = url
+        return url
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete session and all associated files."""
@@ -90,10 +195,11 @@ class UploadService:
 
         # Delete files from S3
         files = await self._s3.list_files(f"sessions/{session_id}/")
-        for file_key in files:
-            await self._s3.delete_file(file_key)
+        if files:
+            await self._s3.delete_objects(files)
 
         # Delete session
         await self._sessions.delete(session_id)
+        _VIDEO_URL_CACHE.pop(session_id, None)
         logger.info(f"Deleted session {session_id}")
         return True
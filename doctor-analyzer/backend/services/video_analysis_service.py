@@ -1,16 +1,21 @@
 """Service for video emotion analysis."""
 
+import asyncio
 import logging
+import time
 
 from infrastructure.aws.rekognition_client import RekognitionClient
 from infrastructure.aws.s3_client import S3Client
-from infrastructure.websocket.connection_manager import ConnectionManager
+from infrastructure.websocket.connection_manager import ConnectionManager, EMOTION_BATCH_SIZE
 from domain.session import AnalysisSession, SessionStore
 from domain.emotion import VideoEmotionTimeline
 from domain.analysis import AnalysisStatus
 
 logger = logging.getLogger(__name__)
 
+# Longest a detection waits in the batch before it is streamed, in seconds
+_EMOTION_FLUSH_INTERVAL = 0.1
+
 
 class VideoAnalysisService:
     """Orchestrates video upload and emotion analysis pipeline."""
@@ -75,43 +80,50 @@ class VideoAnalysisService:
             duration_ms=0,
         )
 
-        # Collect detections while streaming to WebSocket
+        # Collect detections while streaming them to WebSocket clients in
+        # batches of up to EMOTION_BATCH_SIZE, or every _EMOTION_FLUSH_INTERVAL
         detection_count = 0
+        batch = []
+        last_flush = time.monotonic()
 
         async for detection in self._rekognition.get_face_detection_results(job_id):
-            timeline.add_detection(detection)
+            detection_dict = timeline.add_detection(detection)
             detection_count += 1
 
-            # Stream to WebSocket clients
-            await self._ws_manager.send_emotion_update(
-                session.session_id,
-                detection.timestamp_ms,
-                [e.to_dict() for e in detection.emotions],
-                detection.bounding_box.to_dict(),
-            )
-
-            # Update progress periodically
-            if detection_count % 10 == 0:
-                await self._ws_manager.send_status_update(
+            # Skip the streaming payload if nobody listens
+            if not self._ws_manager.has_connections(session.session_id):
+                continue
+
+            batch.append({
+                "timestamp_ms": detection_dict["timestamp_ms"],
+                "emotions": detection_dict["emotions"],
+                "bounding_box": detection_dict["bounding_box"],
+            })
+            if len(batch) >= EMOTION_BATCH_SIZE or time.monotonic() - last_flush >= _EMOTION_FLUSH_INTERVAL:
+                await self._ws_manager.send_emotion_batch(session.session_id, batch)
+                batch = []
+                last_flush = time.monotonic()
+
+                self._ws_manager.queue_status_update(
                     session.session_id,
                     AnalysisStatus.PROCESSING_VIDEO.value,
                     progress=min(0.9, detection_count / 100),
                     message=f"Processing face detections... ({detection_count} detected so far)",
                 )
 
+        await self._ws_manager.send_emotion_batch(session.session_id, batch)
+
         # Estimate duration from last detection
         if timeline.detections:
             timeline.duration_ms = max(d.timestamp_ms for d in timeline.detections) + 1000
 
-        # Save results to S3
+        # Save results to S3, plus individual face detections for video
+        # overlay on session review; the two writes are independent
         results_key = f"sessions/{session.session_id}/results/video_emotions.json"
-        await self._s3.upload_json(timeline.to_dict(), results_key)
-
-        # Save individual face detections for video overlay on session review
         detections_key = f"sessions/{session.session_id}/results/face_detections.json"
-        await self._s3.upload_json(
-            [detection.to_dict() for detection in timeline.detections],
-            detections_key,
+        await asyncio.gather(
+            self._s3.upload_json(timeline.to_dict(), results_key),
+            self._s3.upload_json(timeline.detection_dicts, detections_key),
         )
 
         # Update session
@@ -135,6 +135,47 @@ async def test_transcript_analysis_bedrock_failure(
     assert result is None
 
 
+# ── Use Cases 1 + 2 combined ────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_enhance_injury_check_merges_both_use_cases(
+    mock_bedrock, mock_ws_manager, sample_session,
+):
+    async def respond(prompt):
+        if "Content Moderation Labels" in prompt:
+            return {"has_signals": True, "severity": "moderate", "confidence": 0.6}
+        return {"has_verbal_signals": True, "severity": "high", "confidence": 0.8}
+
+    mock_bedrock.invoke_model_json.side_effect = respond
+
+    service = BedrockAnalysisService(mock_bedrock, mock_ws_manager)
+    result = await service.enhance_injury_check(sample_session)
+
+    assert result.severity == "moderate"
+    assert result.transcript_analysis["has_verbal_signals"] is True
+    assert result.transcript_analysis["severity"] == "high"
+    assert mock_bedrock.invoke_model_json.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_enhance_injury_check_keeps_labels_when_transcript_fails(
+    mock_bedrock, mock_ws_manager, sample_session,
+):
+    async def respond(prompt):
+        if "Content Moderation Labels" in prompt:
+            return {"has_signals": True, "severity": "moderate", "confidence": 0.6}
+        raise RuntimeError("throttled")
+
+    mock_bedrock.invoke_model_json.side_effect = respond
+
+    service = BedrockAnalysisService(mock_bedrock, mock_ws_manager)
+    result = await service.enhance_injury_check(sample_session)
+
+    assert result.severity == "moderate"
+    assert result.transcript_analysis is None
+
+
 # ── Use Case 3: Multi-Modal Aggregation ─────────────────────────────
 
 
@@ -215,6 +256,21 @@ def test_extract_transcript_around_timestamps(sample_transcription_segments):
     assert "disappear" in result
 
 
+def test_extract_transcript_excludes_segments_outside_window(sample_transcription_segments):
+    result = BedrockAnalysisService._extract_transcript_around_timestamps(
+        sample_transcription_segments,
+        timestamps_ms=[14000, 1000],
+        window_ms=1000,
+    )
+
+    # Windows 0-2s and 13-15s; output stays in transcript order, no duplicates
+    assert result == (
+        "I've been feeling really down lately. "
+        "My therapist says I should try journaling. "
+        "I guess that could help."
+    )
+
+
 def test_extract_transcript_empty_timestamps(sample_transcription_segments):
     result = BedrockAnalysisService._extract_transcript_around_timestamps(
         sample_transcription_segments,
@@ -0,0 +1,76 @@
+"""Tests for RekognitionClient job completion notifications over SQS."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from api import dependencies
+from config.settings import AWSSettings
+from infrastructure.aws import rekognition_client
+from infrastructure.aws.rekognition_client import RekognitionClient
+
+
+class FakeQueue:
+    """SQS queue stand-in: messages stay visible until deleted, each is received once."""
+
+    def __init__(self):
+        self.messages = []
+        self.deleted = []
+        self._received = set()
+
+    def publish(self, job_id: str, status: str = "SUCCEEDED") -> None:
+        envelope = {"Message": orjson.dumps({"JobId": job_id, "Status": status}).decode()}
+        self.messages.append({
+            "Body": orjson.dumps(envelope).decode(),
+            "ReceiptHandle": f"receipt-{job_id}",
+        })
+
+    def receive_message(self, **kwargs):
+        batch = [m for m in self.messages if m["ReceiptHandle"] not in self._received]
+        self._received.update(m["ReceiptHandle"] for m in batch)
+        return {"Messages": batch}
+
+    def delete_message(self, QueueUrl, ReceiptHandle):
+        self.deleted.append(ReceiptHandle)
+        self.messages = [m for m in self.messages if m["ReceiptHandle"] != ReceiptHandle]
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    queue = FakeQueue()
+    session = MagicMock()
+    session.client.side_effect = lambda name, **kwargs: queue if name == "sqs" else MagicMock()
+    monkeypatch.setattr(rekognition_client, "get_session", lambda settings: session)
+    monkeypatch.setattr(rekognition_client, "_SQS_WAIT_SECONDS", 0)
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_share_one_listener(queue):
+    client = RekognitionClient(AWSSettings(rekognition_sqs_queue_url="https://sqs/queue"))
+    get_status = AsyncMock(return_value="IN_PROGRESS")
+
+    waiters = asyncio.gather(
+        client.await_job_completion("job-a", get_status, timeout=5),
+        client.await_job_completion("job-b", get_status, timeout=5),
+    )
+    await asyncio.sleep(0)
+    # Notifications arrive out of order, in one batch
+    queue.publish("job-b")
+    queue.publish("job-a", status="FAILED")
+
+    assert await waiters == ["FAILED", "SUCCEEDED"]
+    # Resolved by the notifications, not by the status check fallback
+    get_status.assert_not_awaited()
+    assert sorted(queue.deleted) == ["receipt-job-a", "receipt-job-b"]
+
+
+def test_rekognition_client_is_shared(monkeypatch):
+    monkeypatch.setattr(dependencies, "RekognitionClient", MagicMock(side_effect=lambda settings: object()))
+    dependencies.get_rekognition_client.cache_clear()
+    try:
+        assert dependencies.get_rekognition_client() is dependencies.get_rekognition_client()
+    finally:
+        dependencies.get_rekognition_client.cache_clear()
@@ -81,6 +81,12 @@ export function useWebSocket({
               cb.onEmotionUpdate?.(message)
               break
 
+            case 'emotion_batch':
+              for (const detection of message.detections) {
+                cb.onEmotionUpdate?.({ type: 'emotion_update', ...detection })
+              }
+              break
+
             case 'status_update':
               setStatus(message.status)
               cb.onStatusUpdate?.(message)
@@ -90,6 +96,12 @@ export function useWebSocket({
               cb.onTranscriptionUpdate?.(message)
               break
 
+            case 'transcription_batch':
+              for (const segment of message.segments) {
+                cb.onTranscriptionUpdate?.({ type: 'transcription_update', ...segment })
+              }
+              break
+
             case 'complete':
               setStatus('completed')
               cb.onComplete?.(message.results)
@@ -4,6 +4,7 @@ import type {
   AnalysisSessionFull,
   EmotionUpdateMessage,
   Patient,
+  PresignVideoResponse,
   UploadVideoResponse,
 } from '../types/analysis'
 
@@ -45,18 +46,18 @@ export const api = {
     file: File,
     patientId: string
   ): Promise<UploadVideoResponse> {
-    const formData = new FormData()
-    formData.append('file', file)
-    formData.append('patient_id', patientId)
-
-    const response = await client.post<UploadVideoResponse>(
-      '/api/upload/video',
-      formData,
-      {
-        headers: { 'Content-Type': 'multipart/form-data' },
-      }
+    // Ask the backend for a presigned URL, then PUT the file straight to S3
+    const contentType = file.type || 'video/mp4'
+    const presign = await client.post<PresignVideoResponse>(
+      '/api/upload/video/presign',
+      { patient_id: patientId, filename: file.name, content_type: contentType }
     )
-    return response.data
+    const { upload_url, ...result } = presign.data
+
+    await axios.put(upload_url, file, {
+      headers: { 'Content-Type': contentType },
+    })
+    return result
   },
 
   // Session endpoints
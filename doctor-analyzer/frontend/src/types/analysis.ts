@@ -164,6 +164,11 @@ export interface EmotionUpdateMessage {
   bounding_box: BoundingBox;
 }
 
+export interface EmotionBatchMessage {
+  type: 'emotion_batch';
+  detections: Omit<EmotionUpdateMessage, 'type'>[];
+}
+
 export interface StatusUpdateMessage {
   type: 'status_update';
   status: AnalysisStatus;
@@ -178,6 +183,11 @@ export interface TranscriptionUpdateMessage {
   end_time: number;
 }
 
+export interface TranscriptionBatchMessage {
+  type: 'transcription_batch';
+  segments: Omit<TranscriptionUpdateMessage, 'type'>[];
+}
+
 export interface CompleteMessage {
   type: 'complete';
   results: AnalysisSessionFull;
@@ -190,8 +200,10 @@ export interface ErrorMessage {
 
 export type WebSocketMessage =
   | EmotionUpdateMessage
+  | EmotionBatchMessage
   | StatusUpdateMessage
   | TranscriptionUpdateMessage
+  | TranscriptionBatchMessage
   | CompleteMessage
   | ErrorMessage;
 
@@ -202,3 +214,7 @@ export interface UploadVideoResponse {
   status: AnalysisStatus;
 }
 
+export interface PresignVideoResponse extends UploadVideoResponse {
+  upload_url: string;
+}
+
@@ -1,10 +1,14 @@
 """Base agent class implementing the Template Method pattern."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from openai import OpenAIError
 
 from domain.state import AssistantState
 from infrastructure.llm_client import LLMClient
+from infrastructure.semantic_cache import SemanticCache
 
 
 class BaseAgent(ABC):
@@ -15,20 +19,25 @@ class BaseAgent(ABC):
     defines the algorithm skeleton, and subclasses implement specific steps.
     """
 
-    def __init__(self, llm_client: LLMClient):
+    # The agent's name for logging and identification, set by each subclass
+    name: str
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        response_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize the agent.
 
         Args:
             llm_client: The LLM client for making API calls.
+            response_cache: Optional semantic cache for LLM responses.
         """
         self._llm_client = llm_client
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Return the agent's name for logging and identification."""
-        pass
+        self._response_cache = response_cache
+        self._skipped_message = f"{self.name}: Skipped"
+        self._completed_message = f"{self.name}: Completed"
 
     @abstractmethod
     def _build_prompt(self, state: AssistantState) -> str:
@@ -73,14 +82,74 @@ class BaseAgent(ABC):
         """
         return False
 
-    def execute(self, state: AssistantState) -> Dict[str, Any]:
+    def _cache_scope(self, state: AssistantState) -> Optional[str]:
+        """
+        Get the scope under which this agent's responses are cached.
+
+        Responses depend on the query and the patient, so they are scoped by
+        patient identifier. Override to return None to disable caching.
+
+        Args:
+            state: Current workflow state.
+
+        Returns:
+            The cache scope, or None if the response must not be cached.
+        """
+        return state.get("patient_identifier") or ""
+
+    def _cache_text(self, state: AssistantState) -> str:
+        """
+        Get the text this agent's responses are cached by.
+
+        Defaults to the doctor's query. Override when the response depends
+        on an earlier agent's output rather than on the query alone.
+
+        Args:
+            state: Current workflow state.
+
+        Returns:
+            The text to match cached responses against.
+        """
+        return state["query"]
+
+    async def _get_cached_response(self, state: AssistantState) -> Optional[str]:
+        """Return a cached response for this query, if any."""
+        scope = self._cache_scope(state)
+        if self._response_cache is None or scope is None:
+            return None
+        return await asyncio.to_thread(
+            self._response_cache.get, self.name, scope, self._cache_text(state)
+        )
+
+    async def _cache_response(self, state: AssistantState, response: str) -> None:
+        """Store a fresh LLM response in the cache."""
+        scope = self._cache_scope(state)
+        if self._response_cache is None or scope is None:
+            return
+        await asyncio.to_thread(
+            self._response_cache.put,
+            self.name,
+            scope,
+            self._cache_text(state),
+            response,
+        )
+
+    async def _invoke_cached(self, state: AssistantState, prompt: str) -> str:
+        """Invoke the LLM unless a semantically equivalent query was answered recently."""
+        response = await self._get_cached_response(state)
+        if response is None:
+            response = await self._llm_client.ainvoke(prompt)
+            await self._cache_response(state, response)
+        return response
+
+    async def execute(self, state: AssistantState) -> Dict[str, Any]:
         """
         Execute the agent's task.
 
         This is the template method that defines the algorithm:
         1. Check if should skip
         2. Build prompt
-        3. Call LLM
+        3. Call LLM (asynchronously, so independent agents can run concurrently)
         4. Process response
         5. Return state updates
 
@@ -91,17 +160,17 @@ class BaseAgent(ABC):
             Dictionary of state updates.
         """
         if self._should_skip(state):
-            return {"messages": [f"{self.name}: Skipped"]}
+            return {"messages": [self._skipped_message]}
 
         try:
             prompt = self._build_prompt(state)
-            response = self._llm_client.invoke(prompt)
+            response = await self._invoke_cached(state, prompt)
             updates = self._process_response(response, state)
             updates["messages"] = updates.get("messages", []) + [
-                f"{self.name}: Completed"
+                self._completed_message
             ]
             return updates
-        except Exception as e:
+        except OpenAIError as e:
             return {
                 "error": f"{self.name} error: {str(e)}",
                 "messages": [f"{self.name}: Failed - {str(e)}"],
@@ -3,7 +3,7 @@
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from config.prompts import Prompts
+from config.prompts import render_explainability
 from domain.state import AssistantState
 
 
@@ -18,16 +18,18 @@ class ExplainabilityAgent(BaseAgent):
     - Limitation acknowledgments
     """
 
-    @property
-    def name(self) -> str:
-        return "ExplainabilityAgent"
+    name = "ExplainabilityAgent"
 
     def _should_skip(self, state: AssistantState) -> bool:
         """Skip if there's no analysis to explain."""
         return not state.get("analysis") or bool(state.get("error"))
 
+    def _cache_text(self, state: AssistantState) -> str:
+        """Key on the analysis: the same query can yield a different one."""
+        return state.get("analysis", "")
+
     def _build_prompt(self, state: AssistantState) -> str:
-        return Prompts.EXPLAINABILITY.format(
+        return render_explainability(
             analysis=state.get("analysis", ""),
             patient_context=state.get("patient_context", "No patient context"),
         )
@@ -1,11 +1,15 @@
 """Lookup agent for retrieving patient records from the vector store."""
 
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
+
+from openai import OpenAIError
 
 from .base_agent import BaseAgent
-from config.prompts import Prompts
+from config.prompts import render_lookup
 from domain.state import AssistantState
 from infrastructure.vector_store import VectorStore
+from infrastructure.semantic_cache import SemanticCache
 
 
 class LookupAgent(BaseAgent):
@@ -16,30 +20,41 @@ class LookupAgent(BaseAgent):
     to the doctor's query, filtering by patient when specified.
     """
 
-    def __init__(self, llm_client, vector_store: VectorStore):
+    name = "LookupAgent"
+
+    _SKIPPED_MESSAGE = f"{name}: Skipped - no patient context needed"
+    _CACHED_MESSAGE = f"{name}: Served from cache"
+    _NOT_FOUND_MESSAGE = f"{name}: No records found"
+
+    def __init__(
+        self,
+        llm_client,
+        vector_store: VectorStore,
+        response_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize the lookup agent.
 
         Args:
             llm_client: The LLM client for making API calls.
             vector_store: The vector store for patient records.
+            response_cache: Optional semantic cache for LLM responses.
         """
-        super().__init__(llm_client)
+        super().__init__(llm_client, response_cache)
         self._vector_store = vector_store
 
-    @property
-    def name(self) -> str:
-        return "LookupAgent"
-
     def _should_skip(self, state: AssistantState) -> bool:
         """Skip if no patient context is required."""
         return not state.get("requires_patient_context", True)
 
-    def _build_prompt(self, state: AssistantState) -> str:
-        return Prompts.LOOKUP.format(
-            search_results=state.get("_search_results", "No results found"),
+    def _build_prompt(
+        self, state: AssistantState, search_results: str = "No results found"
+    ) -> str:
+        return render_lookup(
+            search_results=search_results,
             query=state["query"],
-            patient_identifier=state.get("patient_identifier", "Not specified"),
+            # The key is present but None when no patient was identified
+            patient_identifier=state.get("patient_identifier") or "Not specified",
         )
 
     def _process_response(
@@ -50,55 +65,63 @@ class LookupAgent(BaseAgent):
             "search_successful": True,
         }
 
-    def execute(self, state: AssistantState) -> Dict[str, Any]:
+    async def execute(self, state: AssistantState) -> Dict[str, Any]:
         """
         Execute patient lookup with vector store search.
 
         First searches the vector store, then uses LLM to summarize results.
+        A cached summary for an equivalent query skips both steps.
         """
         if self._should_skip(state):
             return {
-                "messages": [f"{self.name}: Skipped - no patient context needed"],
+                "messages": [self._SKIPPED_MESSAGE],
                 "patient_context": "",
                 "search_successful": True,
             }
 
         try:
+            cached = await self._get_cached_response(state)
+            if cached is not None:
+                return {
+                    "patient_context": cached,
+                    "search_successful": True,
+                    "messages": [self._CACHED_MESSAGE],
+                }
+
             # Search vector store
             patient_id = state.get("patient_identifier")
             query = state["query"]
 
             if patient_id:
-                results = self._vector_store.search_by_patient(
+                results = await asyncio.to_thread(
+                    self._vector_store.search_by_patient,
                     query=query,
                     patient_identifier=patient_id,
                     k=3,
                 )
+            elif state.get("prefetched_results") is not None:
+                # General search already run alongside the router
+                results = state["prefetched_results"]
             else:
-                results = self._vector_store.search(query=query, k=5)
+                results = await asyncio.to_thread(self._vector_store.search, query=query, k=5)
 
             if not results:
                 return {
                     "patient_context": "No patient records found matching the query.",
                     "search_successful": False,
-                    "messages": [f"{self.name}: No records found"],
+                    "messages": [self._NOT_FOUND_MESSAGE],
                 }
 
             # Format search results
             formatted_results = "\n\n---\n\n".join(
-                [
-                    f"Record {i+1}:\n{r['content']}"
-                    for i, r in enumerate(results)
-                ]
+                f"Record {i}:\n{r['content']}"
+                for i, r in enumerate(results, start=1)
             )
 
-            # Store for prompt building
-            state_copy = dict(state)
-            state_copy["_search_results"] = formatted_results
-
             # Use LLM to summarize and extract relevant info
-            prompt = self._build_prompt(state_copy)
-            response = self._llm_client.invoke(prompt)
+            prompt = self._build_prompt(state, search_results=formatted_results)
+            response = await self._llm_client.ainvoke(prompt)
+            await self._cache_response(state, response)
 
             return {
                 "patient_context": response,
@@ -106,7 +129,7 @@ class LookupAgent(BaseAgent):
                 "messages": [f"{self.name}: Found {len(results)} relevant records"],
             }
 
-        except Exception as e:
+        except OpenAIError as e:
             return {
                 "error": f"{self.name} error: {str(e)}",
                 "messages": [f"{self.name}: Failed - {str(e)}"],
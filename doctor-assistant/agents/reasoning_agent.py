@@ -3,7 +3,7 @@
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from config.prompts import Prompts
+from config.prompts import render_general_medical, render_reasoning
 from domain.state import AssistantState
 
 
@@ -16,9 +16,7 @@ class ReasoningAgent(BaseAgent):
     It explicitly avoids making diagnoses or treatment recommendations.
     """
 
-    @property
-    def name(self) -> str:
-        return "ReasoningAgent"
+    name = "ReasoningAgent"
 
     def _should_skip(self, state: AssistantState) -> bool:
         """Skip if there was an error in previous steps."""
@@ -27,9 +25,9 @@ class ReasoningAgent(BaseAgent):
     def _build_prompt(self, state: AssistantState) -> str:
         # For general queries without patient context
         if not state.get("requires_patient_context", True):
-            return Prompts.GENERAL_MEDICAL.format(query=state["query"])
+            return render_general_medical(query=state["query"])
 
-        return Prompts.REASONING.format(
+        return render_reasoning(
             patient_context=state.get("patient_context", "No patient context available"),
             query=state["query"],
         )
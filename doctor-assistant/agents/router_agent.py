@@ -1,12 +1,29 @@
 """Router agent for query classification and patient identification."""
 
 import json
-from typing import Dict, Any
+import re
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from openai import OpenAIError
 
 from .base_agent import BaseAgent
-from config.prompts import Prompts
+from config.prompts import render_router
 from domain.state import AssistantState
 
+# Markdown code fence the LLM sometimes wraps its JSON in
+_FENCE_PATTERN = re.compile(r"^```(?:json)?|```$")
+
+# Distinct queries whose routing is remembered for exact repeats
+_ROUTE_CACHE_SIZE = 256
+
+# Routing used when the LLM response is not a JSON object
+_DEFAULT_ROUTE: Dict[str, Any] = {
+    "patient_identifier": None,
+    "query_type": "general",
+    "requires_patient_context": False,
+}
+
 
 class RouterAgent(BaseAgent):
     """
@@ -18,27 +35,41 @@ class RouterAgent(BaseAgent):
     - Whether the query requires patient-specific context
     """
 
-    @property
-    def name(self) -> str:
-        return "RouterAgent"
+    name = "RouterAgent"
+
+    _ROUTED_MESSAGE = f"{name}: Routed query"
+    _CACHED_MESSAGE = f"{name}: Routed query (cached)"
+
+    def __init__(self, llm_client):
+        """
+        Initialize the router agent.
+
+        Args:
+            llm_client: The LLM client for making API calls.
+        """
+        super().__init__(llm_client)
+        self._route_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _cache_scope(self, state: AssistantState) -> Optional[str]:
+        """Never cache semantically: the patient is what the router extracts."""
+        return None
 
     def _build_prompt(self, state: AssistantState) -> str:
-        return Prompts.ROUTER.format(query=state["query"])
+        return render_router(query=state["query"])
 
     def _process_response(
         self, response: str, state: AssistantState
     ) -> Dict[str, Any]:
+        # Default to general query if parsing fails
+        return self._parse_route(response) or dict(_DEFAULT_ROUTE)
+
+    @staticmethod
+    def _parse_route(response: str) -> Optional[Dict[str, Any]]:
+        """Parse the routing JSON, or return None if it is not a JSON object."""
         try:
             # Clean response and parse JSON
-            cleaned = response.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-
-            parsed = json.loads(cleaned.strip())
+            cleaned = _FENCE_PATTERN.sub("", response.strip())
+            parsed = json.loads(cleaned)
 
             return {
                 "patient_identifier": parsed.get("patient_identifier"),
@@ -47,27 +78,42 @@ class RouterAgent(BaseAgent):
                     "requires_patient_context", False
                 ),
             }
-        except json.JSONDecodeError:
-            # Default to general query if parsing fails
-            return {
-                "patient_identifier": None,
-                "query_type": "general",
-                "requires_patient_context": False,
-            }
+        except (json.JSONDecodeError, AttributeError):
+            return None
+
+    async def execute(self, state: AssistantState) -> Dict[str, Any]:
+        """
+        Override to use JSON-specific LLM call.
+
+        Routing depends only on the query text, so an exact repeat of a
+        successfully routed query reuses its routing without an LLM call.
+        """
+        query = state["query"]
+        cached = self._route_cache.get(query)
+        if cached is not None:
+            self._route_cache.move_to_end(query)
+            return {**cached, "messages": [self._CACHED_MESSAGE]}
 
-    def execute(self, state: AssistantState) -> Dict[str, Any]:
-        """Override to use JSON-specific LLM call."""
         try:
             prompt = self._build_prompt(state)
-            response = self._llm_client.invoke_with_json(prompt)
-            updates = self._process_response(response, state)
-            updates["messages"] = [f"{self.name}: Routed query"]
+            response = await self._llm_client.ainvoke_with_json(prompt)
+            route = self._parse_route(response)
+            if route is None:
+                updates = dict(_DEFAULT_ROUTE)
+            else:
+                self._remember_route(query, route)
+                updates = dict(route)
+            updates["messages"] = [self._ROUTED_MESSAGE]
             return updates
-        except Exception as e:
+        except OpenAIError as e:
             return {
                 "error": f"{self.name} error: {str(e)}",
                 "messages": [f"{self.name}: Failed - {str(e)}"],
-                "patient_identifier": None,
-                "query_type": "general",
-                "requires_patient_context": False,
+                **_DEFAULT_ROUTE,
             }
+
+    def _remember_route(self, query: str, route: Dict[str, Any]) -> None:
+        """Cache a parsed route, evicting the least recently used beyond the cap."""
+        self._route_cache[query] = route
+        if len(self._route_cache) > _ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
@@ -1,8 +1,9 @@
 """Terminal interface for the doctor assistant using Rich for formatting."""
 
 import re
-from typing import Optional
+from typing import AsyncIterator, Optional
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
@@ -17,6 +18,16 @@ THEME = Theme({
     "patient": "blue bold",
 })
 
+# Panel options shared by the final and the streaming response display
+_RESPONSE_PANEL_STYLE = {
+    "title": "[bold green]Assistant Response[/bold green]",
+    "border_style": "green",
+    "padding": (1, 2),
+}
+
+# Redraws per second while a response streams in
+_STREAM_REFRESH_PER_SECOND = 10
+
 
 def _normalize_markdown(text: str) -> str:
     """
@@ -38,6 +49,21 @@ def _normalize_markdown(text: str) -> str:
     return '\n' + text
 
 
+class _StreamingResponse:
+    """
+    Response panel over a growing buffer of streamed text.
+
+    The markdown is parsed when Live redraws, not per received chunk, so a
+    long response is parsed at most _STREAM_REFRESH_PER_SECOND times a second.
+    """
+
+    def __init__(self):
+        self.text = ""
+
+    def __rich__(self) -> Panel:
+        return Panel(Markdown(_normalize_markdown(self.text)), **_RESPONSE_PANEL_STYLE)
+
+
 class CLIInterface:
     """
     Terminal interface for interacting with the doctor assistant.
@@ -130,12 +156,26 @@ All responses include:
         """
         self._console.print()
         normalized = _normalize_markdown(response)
-        self._console.print(Panel(
-            Markdown(normalized),
-            title="[bold green]Assistant Response[/bold green]",
-            border_style="green",
-            padding=(1, 2),
-        ))
+        self._console.print(Panel(Markdown(normalized), **_RESPONSE_PANEL_STYLE))
+        self._console.print()
+
+    async def display_response_stream(self, chunks: AsyncIterator[str]) -> None:
+        """
+        Display the assistant's response while it is being generated.
+
+        Args:
+            chunks: Consecutive pieces of the response text (markdown formatted).
+        """
+        self._console.print()
+        response = _StreamingResponse()
+        with Live(
+            response,
+            console=self._console,
+            refresh_per_second=_STREAM_REFRESH_PER_SECOND,
+            vertical_overflow="visible",
+        ):
+            async for chunk in chunks:
+                response.text += chunk
         self._console.print()
 
     def display_error(self, error: str) -> None:
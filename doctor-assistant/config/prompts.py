@@ -7,6 +7,9 @@ Each agent has a carefully crafted prompt that ensures:
 4. Safety and explainability
 """
 
+from string import Formatter
+from typing import Tuple
+
 
 class Prompts:
     """Collection of prompt templates for all agents."""
@@ -113,3 +116,61 @@ Remember: This is for educational support only. All clinical decisions require p
 ---
 **Disclaimer**: This information is for educational purposes only and should not replace professional medical judgment or current clinical guidelines.
 ---"""
+
+
+
+# Each template is split around its fields once at import, so rendering is
+# plain concatenation rather than re-parsing the format string per call.
+def _split(template: str, *fields: str) -> Tuple[str, ...]:
+    """Return the literal pieces around `fields`, which must appear in this order."""
+    literals = [""]
+    found = []
+    # Formatter unescapes {{ and }}, yielding a separate literal at each escape
+    for literal, field, _, _ in Formatter().parse(template):
+        literals[-1] += literal
+        if field is not None:
+            found.append(field)
+            literals.append("")
+    assert tuple(found) == fields
+    return tuple(literals)
+
+
+_ROUTER = _split(Prompts.ROUTER, "query")
+_LOOKUP = _split(Prompts.LOOKUP, "search_results", "query", "patient_identifier")
+_REASONING = _split(Prompts.REASONING, "patient_context", "query")
+_EXPLAINABILITY = _split(Prompts.EXPLAINABILITY, "analysis", "patient_context")
+_GENERAL_MEDICAL = _split(Prompts.GENERAL_MEDICAL, "query")
+
+
+def render_router(query: str) -> str:
+    """Render Prompts.ROUTER; equivalent to its str.format."""
+    return _ROUTER[0] + query + _ROUTER[1]
+
+
+def render_lookup(search_results: str, query: str, patient_identifier: str) -> str:
+    """Render Prompts.LOOKUP; equivalent to its str.format."""
+    return (
+        _LOOKUP[0] + search_results
+        + _LOOKUP[1] + query
+        + _LOOKUP[2] + patient_identifier
+        + _LOOKUP[3]
+    )
+
+
+def render_reasoning(patient_context: str, query: str) -> str:
+    """Render Prompts.REASONING; equivalent to its str.format."""
+    return _REASONING[0] + patient_context + _REASONING[1] + query + _REASONING[2]
+
+
+def render_explainability(analysis: str, patient_context: str) -> str:
+    """Render Prompts.EXPLAINABILITY; equivalent to its str.format."""
+    return (
+        _EXPLAINABILITY[0] + analysis
+        + _EXPLAINABILITY[1] + patient_context
+        + _EXPLAINABILITY[2]
+    )
+
+
+def render_general_medical(query: str) -> str:
+    """Render Prompts.GENERAL_MEDICAL; equivalent to its str.format."""
+    return _GENERAL_MEDICAL[0] + query + _GENERAL_MEDICAL[1]
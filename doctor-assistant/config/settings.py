@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +15,7 @@ class Settings:
     chroma_persist_dir: str = os.getenv("CHROMA_PERSIST_DIR", "./chroma_db")
     patients_data_path: str = os.getenv("PATIENTS_DATA_PATH", "./data/patients.json")
     collection_name: str = "patient_records"
+    cache_collection_name: str = "response_cache"
 
     def validate(self) -> None:
         """Validate required settings are present."""
@@ -24,8 +26,9 @@ class Settings:
             )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Factory function to create and validate settings."""
+    """Factory function to create and validate settings, once per process."""
     settings = Settings()
     settings.validate()
     return settings
@@ -1,6 +1,7 @@
 """Patient domain models using dataclasses for immutability and type safety."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional
 
 
@@ -92,135 +93,67 @@ class Patient:
 
     def to_document_text(self) -> str:
         """Convert patient record to searchable text document."""
-        sections = [
-            f"Patient ID: {self.id}",
-            f"Name: {self.demographics.name}",
-            f"Age: {self.demographics.age}",
-            f"Gender: {self.demographics.gender}",
-            f"Blood Type: {self.demographics.blood_type}",
-            "",
-            "=== CONDITIONS ===",
-        ]
-
-        for condition in self.conditions:
-            sections.append(
-                f"- {condition.name} (Diagnosed: {condition.diagnosed_date}, "
-                f"Status: {condition.status}, Severity: {condition.severity})"
-            )
-            sections.append(f"  Notes: {condition.notes}")
-
-        sections.append("")
-        sections.append("=== MEDICATIONS ===")
-        for med in self.medications:
-            sections.append(
-                f"- {med.name} {med.dosage} ({med.frequency}) - {med.purpose}"
-            )
+        return self._document_text
 
-        sections.append("")
-        sections.append("=== ALLERGIES ===")
+    @cached_property
+    def _document_text(self) -> str:
+        """Searchable text document, built once per record."""
         if self.allergies:
-            for allergy in self.allergies:
-                sections.append(
-                    f"- {allergy.allergen}: {allergy.reaction} (Severity: {allergy.severity})"
-                )
-        else:
-            sections.append("- No known allergies")
-
-        sections.append("")
-        sections.append("=== LAB RESULTS ===")
-        for lab in self.lab_results:
-            sections.append(
-                f"- {lab.test}: {lab.value} (Reference: {lab.reference_range}, "
-                f"Status: {lab.status}) - Date: {lab.date}"
+            allergies = "\n".join(
+                f"- {a.allergen}: {a.reaction} (Severity: {a.severity})"
+                for a in self.allergies
             )
-
-        sections.append("")
-        sections.append("=== VISIT HISTORY ===")
-        for visit in self.visits:
-            sections.append(f"- {visit.date}: {visit.reason} (Provider: {visit.provider})")
-            sections.append(f"  Notes: {visit.notes}")
-
-        return "\n".join(sections)
+        else:
+            allergies = "- No known allergies"
+
+        return "\n".join((
+            f"Patient ID: {self.id}\n"
+            f"Name: {self.demographics.name}\n"
+            f"Age: {self.demographics.age}\n"
+            f"Gender: {self.demographics.gender}\n"
+            f"Blood Type: {self.demographics.blood_type}\n"
+            "\n"
+            "=== CONDITIONS ===",
+            *(
+                f"- {c.name} (Diagnosed: {c.diagnosed_date}, "
+                f"Status: {c.status}, Severity: {c.severity})\n"
+                f"  Notes: {c.notes}"
+                for c in self.conditions
+            ),
+            "\n=== MEDICATIONS ===",
+            *(
+                f"- {m.name} {m.dosage} ({m.frequency}) - {m.purpose}"
+                for m in self.medications
+            ),
+            "\n=== ALLERGIES ===",
+            allergies,
+            "\n=== LAB RESULTS ===",
+            *(
+                f"- {l.test}: {l.value} (Reference: {l.reference_range}, "
+                f"Status: {l.status}) - Date: {l.date}"
+                for l in self.lab_results
+            ),
+            "\n=== VISIT HISTORY ===",
+            *(
+                f"- {v.date}: {v.reason} (Provider: {v.provider})\n"
+                f"  Notes: {v.notes}"
+                for v in self.visits
+            ),
+        ))
 
     @classmethod
     def from_dict(cls, data: dict) -> "Patient":
         """Create Patient instance from dictionary."""
-        demographics = Demographics(
-            name=data["demographics"]["name"],
-            age=data["demographics"]["age"],
-            gender=data["demographics"]["gender"],
-            blood_type=data["demographics"]["blood_type"],
-            date_of_birth=data["demographics"]["date_of_birth"],
-            contact=data["demographics"]["contact"],
-        )
-
-        conditions = [
-            Condition(
-                name=c["name"],
-                diagnosed_date=c["diagnosed_date"],
-                status=c["status"],
-                severity=c["severity"],
-                notes=c["notes"],
-            )
-            for c in data.get("conditions", [])
-        ]
-
-        medications = [
-            Medication(
-                name=m["name"],
-                dosage=m["dosage"],
-                frequency=m["frequency"],
-                start_date=m["start_date"],
-                purpose=m["purpose"],
-            )
-            for m in data.get("medications", [])
-        ]
-
-        allergies = [
-            Allergy(
-                allergen=a["allergen"],
-                reaction=a["reaction"],
-                severity=a["severity"],
-            )
-            for a in data.get("allergies", [])
-        ]
-
-        lab_results = [
-            LabResult(
-                test=l["test"],
-                value=l["value"],
-                date=l["date"],
-                reference_range=l["reference_range"],
-                status=l["status"],
-            )
-            for l in data.get("lab_results", [])
-        ]
-
-        visits = []
-        for v in data.get("visits", []):
-            vitals = None
-            if "vitals" in v:
-                vitals = Vitals(
-                    weight=v["vitals"].get("weight"),
-                    height=v["vitals"].get("height"),
-                    bmi=v["vitals"].get("bmi"),
-                )
-            visits.append(
-                Visit(
-                    date=v["date"],
-                    reason=v["reason"],
-                    provider=v["provider"],
-                    notes=v["notes"],
-                    vitals=vitals,
-                )
-            )
-
+        # Record keys match the dataclass fields, so each record unpacks directly
         return cls(
             id=data["id"],
-            demographics=demographics,
-            conditions=conditions,
-            medications=medications,
-            allergies=allergies,
-            lab_results=lab_results,
-            visits=visits,
+            demographics=Demographics(**data["demographics"]),
+            conditions=[Condition(**c) for c in data.get("conditions", [])],
+            medications=[Medication(**m) for m in data.get("medications", [])],
+            allergies=[Allergy(**a) for a in data.get("allergies", [])],
+            lab_results=[LabResult(**l) for l in data.get("lab_results", [])],
+            visits=[
+                Visit(**{**v, "vitals": Vitals(**v["vitals"]) if "vitals" in v else None})
+                for v in data.get("visits", [])
+            ],
         )
@@ -1,7 +1,7 @@
 """LangGraph state definitions for the multi-agent workflow."""
 
 from enum import Enum
-from typing import TypedDict, List, Optional, Annotated
+from typing import Any, Dict, TypedDict, List, Optional, Annotated
 from operator import add
 
 
@@ -42,6 +42,9 @@ class AssistantState(TypedDict):
     query_type: str
     requires_patient_context: bool
 
+    # Speculative general search run concurrently with the router
+    prefetched_results: Optional[List[Dict[str, Any]]]
+
     # Lookup output
     patient_context: str
     search_successful: bool
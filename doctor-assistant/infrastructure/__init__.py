@@ -1,4 +1,5 @@
 from .llm_client import LLMClient
 from .vector_store import VectorStore
+from .semantic_cache import SemanticCache
 
-__all__ = ["LLMClient", "VectorStore"]
+__all__ = ["LLMClient", "VectorStore", "SemanticCache"]
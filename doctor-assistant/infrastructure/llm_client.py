@@ -6,6 +6,11 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from config.settings import Settings
 
+_JSON_SYSTEM_MESSAGE = (
+    "You are a helpful assistant that responds only in valid JSON format. "
+    "Do not include any text before or after the JSON object."
+)
+
 
 class LLMClient:
     """
@@ -45,15 +50,35 @@ class LLMClient:
         Returns:
             The LLM's response as a string.
         """
+        response = self._llm.invoke(self._build_messages(prompt, system_message))
+        return response.content
+
+    async def ainvoke(self, prompt: str, system_message: Optional[str] = None) -> str:
+        """
+        Invoke the LLM asynchronously.
+
+        Uses the async OpenAI client underneath, whose pooled HTTP connections
+        are shared by every concurrent call.
+
+        Args:
+            prompt: The user prompt to send.
+            system_message: Optional system message for context.
+
+        Returns:
+            The LLM's response as a string.
+        """
+        response = await self._llm.ainvoke(self._build_messages(prompt, system_message))
+        return response.content
+
+    @staticmethod
+    def _build_messages(prompt: str, system_message: Optional[str]) -> list:
         messages = []
 
         if system_message:
             messages.append(SystemMessage(content=system_message))
 
         messages.append(HumanMessage(content=prompt))
-
-        response = self._llm.invoke(messages)
-        return response.content
+        return messages
 
     def invoke_with_json(self, prompt: str) -> str:
         """
@@ -67,8 +92,16 @@ class LLMClient:
         Returns:
             The LLM's response (should be valid JSON).
         """
-        system_msg = (
-            "You are a helpful assistant that responds only in valid JSON format. "
-            "Do not include any text before or after the JSON object."
-        )
-        return self.invoke(prompt, system_message=system_msg)
+        return self.invoke(prompt, system_message=_JSON_SYSTEM_MESSAGE)
+
+    async def ainvoke_with_json(self, prompt: str) -> str:
+        """
+        Invoke the LLM asynchronously expecting JSON output.
+
+        Args:
+            prompt: The prompt expecting JSON response.
+
+        Returns:
+            The LLM's response (should be valid JSON).
+        """
+        return await self.ainvoke(prompt, system_message=_JSON_SYSTEM_MESSAGE)
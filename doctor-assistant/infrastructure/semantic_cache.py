@@ -0,0 +1,111 @@
+"""Semantic cache for agent LLM responses, stored in ChromaDB."""
+
+import logging
+import time
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+from infrastructure.vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity a cached query must reach to be reused
+MIN_SIMILARITY = 0.92
+
+# Seconds a cached response stays valid
+TTL_SECONDS = 3600
+
+
+class SemanticCache:
+    """
+    Caches agent responses keyed by the embedding of the doctor's query.
+
+    A lookup hits when a query cached under the same namespace (the agent)
+    and scope (the patient) has cosine similarity >= MIN_SIMILARITY and is
+    younger than TTL_SECONDS. Scoping by patient keeps near-identical
+    questions about different patients from sharing an answer.
+
+    The cache lives in its own collection next to the patient records and
+    is dropped with them when the vector store is cleared for reindexing.
+    It is best-effort: embedding or Chroma failures are logged and treated
+    as a miss, never surfaced to the agent.
+    """
+
+    def __init__(self, vector_store: VectorStore):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            vector_store: The vector store whose client and embeddings to use.
+        """
+        self._vector_store = vector_store
+        # Every agent of one query embeds the same text; embed it once
+        self._embed = lru_cache(maxsize=256)(vector_store.embeddings.embed_query)
+
+    def get(self, namespace: str, scope: str, text: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            namespace: Cache namespace, usually the agent name.
+            scope: Patient identifier the response is about ("" for none).
+            text: The text to match semantically, usually the query.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        try:
+            collection = self._vector_store.get_cache_collection()
+            if collection.count() == 0:
+                return None
+
+            result = collection.query(
+                query_embeddings=[self._embed(text)],
+                n_results=1,
+                where={
+                    "$and": [
+                        {"namespace": namespace},
+                        {"scope": scope},
+                        {"created_at": {"$gte": time.time() - TTL_SECONDS}},
+                    ]
+                },
+                include=["metadatas", "distances"],
+            )
+        except Exception:
+            logger.warning("Semantic cache lookup failed for %s", namespace, exc_info=True)
+            return None
+
+        distances = result["distances"][0]
+        if not distances or 1 - distances[0] < MIN_SIMILARITY:
+            return None
+        return result["metadatas"][0][0]["response"]
+
+    def put(self, namespace: str, scope: str, text: str, response: str) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            namespace: Cache namespace, usually the agent name.
+            scope: Patient identifier the response is about ("" for none).
+            text: The text the response is keyed by, usually the query.
+            response: The LLM response to cache.
+        """
+        now = time.time()
+        try:
+            collection = self._vector_store.get_cache_collection()
+            # Expired entries are never served; drop them so the collection
+            # does not grow without bound
+            collection.delete(where={"created_at": {"$lt": now - TTL_SECONDS}})
+            collection.add(
+                ids=[uuid.uuid4().hex],
+                embeddings=[self._embed(text)],
+                metadatas=[{
+                    "namespace": namespace,
+                    "scope": scope,
+                    "response": response,
+                    "created_at": now,
+                }],
+            )
+        except Exception:
+            logger.warning("Semantic cache store failed for %s", namespace, exc_info=True)
@@ -1,5 +1,6 @@
 """ChromaDB vector store for patient record storage and retrieval."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -8,6 +9,12 @@ from langchain_chroma import Chroma
 
 from config.settings import Settings
 
+# Documents embedded and written per batch when adding documents
+ADD_BATCH_SIZE = 100
+
+# Embedding requests in flight while earlier batches are written
+_EMBED_WORKERS = 4
+
 
 class VectorStore:
     """
@@ -17,15 +24,22 @@ class VectorStore:
     vector database operations from the rest of the application.
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, batch_size: int = ADD_BATCH_SIZE):
         """
         Initialize the vector store.
 
         Args:
             settings: Application settings containing ChromaDB config.
+            batch_size: Documents embedded and written per batch in add_documents.
         """
         self._settings = settings
-        self._embeddings = OpenAIEmbeddings(api_key=settings.openai_api_key)
+        self._batch_size = batch_size
+        self._embeddings = OpenAIEmbeddings(
+            api_key=settings.openai_api_key,
+            # Records and queries are far below the model's 8191-token limit;
+            # skip tokenizing every text locally just to check its length
+            check_embedding_ctx_length=False,
+        )
 
         # Initialize ChromaDB with persistent storage
         self._client = chromadb.PersistentClient(
@@ -34,7 +48,15 @@ class VectorStore:
         )
 
         self._collection_name = settings.collection_name
+        self._cache_collection_name = settings.cache_collection_name
         self._vectorstore: Optional[Chroma] = None
+        # Patient ID -> name of indexed patients, loaded on first patient search
+        self._patient_names: Optional[Dict[str, str]] = None
+
+    @property
+    def embeddings(self) -> OpenAIEmbeddings:
+        """Get the embedding model used for patient records."""
+        return self._embeddings
 
     def initialize(self) -> None:
         """Initialize or load the vector store collection."""
@@ -53,6 +75,10 @@ class VectorStore:
         """
         Add documents to the vector store.
 
+        Documents are embedded in batches on a small thread pool, and each
+        batch is written to Chroma as soon as its embeddings arrive, so the
+        embedding round-trips overlap the writes.
+
         Args:
             texts: List of document texts to embed and store.
             metadatas: List of metadata dicts for each document.
@@ -61,11 +87,27 @@ class VectorStore:
         if self._vectorstore is None:
             self.initialize()
 
-        self._vectorstore.add_texts(
-            texts=texts,
-            metadatas=metadatas,
-            ids=ids,
-        )
+        collection = self._client.get_collection(self._collection_name)
+        batches = [
+            slice(start, start + self._batch_size)
+            for start in range(0, len(texts), self._batch_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=_EMBED_WORKERS) as pool:
+            embedded = pool.map(
+                lambda batch: self._embeddings.embed_documents(texts[batch]),
+                batches,
+            )
+            for batch, embeddings in zip(batches, embedded):
+                collection.upsert(
+                    ids=ids[batch],
+                    embeddings=embeddings,
+                    documents=texts[batch],
+                    metadatas=metadatas[batch],
+                )
+
+        # New documents may add patients to match by name
+        self._patient_names = None
 
     def search(
         self,
@@ -116,54 +158,73 @@ class VectorStore:
         """
         Search for documents related to a specific patient.
 
+        The identifier is resolved to indexed patient IDs first, so the
+        similarity search runs once with a native metadata filter and can
+        only return that patient's records.
+
         Args:
             query: The search query.
             patient_identifier: Patient name or ID.
             k: Number of results to return.
 
         Returns:
-            List of matching documents.
+            List of matching documents; empty if no patient matches.
         """
-        if self._vectorstore is None:
-            self.initialize()
+        patient_ids = self._match_patient_ids(patient_identifier)
+        if not patient_ids:
+            return []
 
-        # Search with patient filter
-        # Try matching by ID or name
-        results = self._vectorstore.similarity_search(
-            query=f"{patient_identifier} {query}",
+        return self.search(
+            query=query,
             k=k,
+            filter_metadata={"patient_id": {"$in": patient_ids}},
         )
 
-        # Filter results that match the patient
-        filtered = []
-        patient_lower = patient_identifier.lower()
-
-        for doc in results:
-            metadata = doc.metadata
-            if (
-                metadata.get("patient_id", "").lower() == patient_lower
-                or patient_lower in metadata.get("patient_name", "").lower()
-                or patient_lower in doc.page_content.lower()
-            ):
-                filtered.append(
-                    {
-                        "content": doc.page_content,
-                        "metadata": metadata,
-                    }
-                )
+    def _match_patient_ids(self, patient_identifier: str) -> List[str]:
+        """
+        Find indexed patients by ID or name, ignoring case.
+
+        Matches an exact ID or any part of a name, e.g. "smith" matches
+        "John Smith". Chroma's metadata filters have no substring operator,
+        so this matches against a cached ID -> name map of indexed patients.
+        """
+        if self._patient_names is None:
+            if self._vectorstore is None:
+                self.initialize()
+
+            collection = self._client.get_collection(self._collection_name)
+            records = collection.get(
+                where={"document_type": "full_record"},
+                include=["metadatas"],
+            )
+            self._patient_names = {
+                metadata["patient_id"]: metadata["patient_name"]
+                for metadata in records["metadatas"]
+            }
 
-        return filtered if filtered else [
-            {"content": doc.page_content, "metadata": doc.metadata}
-            for doc in results[:k]
+        needle = patient_identifier.lower()
+        return [
+            patient_id
+            for patient_id, patient_name in self._patient_names.items()
+            if patient_id.lower() == needle or needle in patient_name.lower()
         ]
 
+    def get_cache_collection(self) -> chromadb.Collection:
+        """Get (creating if needed) the cosine-distance collection for cached responses."""
+        return self._client.get_or_create_collection(
+            self._cache_collection_name,
+            metadata={"hnsw:space": "cosine"},
+        )
+
     def clear_collection(self) -> None:
-        """Clear all documents from the collection."""
-        try:
-            self._client.delete_collection(self._collection_name)
-        except ValueError:
-            pass  # Collection doesn't exist
+        """Clear all documents from the collection, and the responses cached from them."""
+        for name in (self._collection_name, self._cache_collection_name):
+            try:
+                self._client.delete_collection(name)
+            except ValueError:
+                pass  # Collection doesn't exist
         self._vectorstore = None
+        self._patient_names = None
         self.initialize()
 
     def get_collection_count(self) -> int:
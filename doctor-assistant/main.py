@@ -13,6 +13,7 @@ Options:
 """
 
 import sys
+import asyncio
 import argparse
 from pathlib import Path
 
@@ -125,60 +126,74 @@ def main() -> None:
 
     cli.display_info("Ready to assist. Type 'help' for usage information.\n")
 
-    # Main interaction loop
-    while True:
-        try:
-            user_input = cli.get_input().strip()
-
-            if not user_input:
-                continue
+    # One event loop for the whole session: the async OpenAI clients keep
+    # connections bound to the loop they were first used on, so a fresh
+    # asyncio.run() per query would hand them a closed loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
-            # Handle special commands
-            lower_input = user_input.lower()
+    # Main interaction loop
+    try:
+        while True:
+            try:
+                user_input = cli.get_input().strip()
+
+                if not user_input:
+                    continue
+
+                # Handle special commands
+                lower_input = user_input.lower()
+
+                if lower_input in ("quit", "exit", "q"):
+                    cli.display_info("Goodbye! Stay healthy.")
+                    break
+
+                if lower_input == "help":
+                    cli.display_help()
+                    continue
+
+                if lower_input == "patients":
+                    if patient_list:
+                        cli.display_patients_list(patient_list)
+                    else:
+                        cli.display_info("No patient records available.")
+                    continue
+
+                if lower_input == "reindex":
+                    cli.display_info("Reindexing patient data...")
+                    count = indexing_service.reindex_all()
+                    cli.display_success(f"Reindexed {count} documents.")
+                    patient_list = get_patient_list(indexing_service)
+                    continue
+
+                # Process the query
+                cli.display_processing()
+
+                if args.debug:
+                    # Show full trace in debug mode
+                    trace = loop.run_until_complete(
+                        graph_service.get_workflow_trace(user_input)
+                    )
+                    cli.display_trace(trace)
+                    response = trace.get("final_response", "No response generated.")
+                    cli.display_response(response)
+                else:
+                    loop.run_until_complete(cli.display_response_stream(
+                        graph_service.stream_query(user_input)
+                    ))
 
-            if lower_input in ("quit", "exit", "q"):
-                cli.display_info("Goodbye! Stay healthy.")
+            except KeyboardInterrupt:
+                cli.display_info("\nSession interrupted. Goodbye!")
                 break
-
-            if lower_input == "help":
-                cli.display_help()
-                continue
-
-            if lower_input == "patients":
-                if patient_list:
-                    cli.display_patients_list(patient_list)
-                else:
-                    cli.display_info("No patient records available.")
-                continue
-
-            if lower_input == "reindex":
-                cli.display_info("Reindexing patient data...")
-                count = indexing_service.reindex_all()
-                cli.display_success(f"Reindexed {count} documents.")
-                patient_list = get_patient_list(indexing_service)
-                continue
-
-            # Process the query
-            cli.display_processing()
-
-            if args.debug:
-                # Show full trace in debug mode
-                trace = graph_service.get_workflow_trace(user_input)
-                cli.display_trace(trace)
-                response = trace.get("final_response", "No response generated.")
-            else:
-                response = graph_service.process_query(user_input)
-
-            cli.display_response(response)
-
-        except KeyboardInterrupt:
-            cli.display_info("\nSession interrupted. Goodbye!")
-            break
-        except Exception as e:
-            cli.display_error(f"An error occurred: {e}")
-            if args.debug:
-                import traceback
-                traceback.print_exc()
+            except Exception as e:
+                cli.display_error(f"An error occurred: {e}")
+                if args.debug:
+                    import traceback
+                    traceback.print_exc()
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
 """LangGraph workflow orchestration service."""
 
-from typing import Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
 from langgraph.graph import StateGraph, END
 
 from domain.state import AssistantState
 from infrastructure.llm_client import LLMClient
 from infrastructure.vector_store import VectorStore
+from infrastructure.semantic_cache import SemanticCache
 from agents import (
     RouterAgent,
     LookupAgent,
@@ -34,11 +36,14 @@ class GraphService:
         self._llm_client = llm_client
         self._vector_store = vector_store
 
+        # Near-duplicate questions about the same patient reuse recent answers
+        response_cache = SemanticCache(vector_store)
+
         # Initialize agents
         self._router = RouterAgent(llm_client)
-        self._lookup = LookupAgent(llm_client, vector_store)
-        self._reasoning = ReasoningAgent(llm_client)
-        self._explainability = ExplainabilityAgent(llm_client)
+        self._lookup = LookupAgent(llm_client, vector_store, response_cache)
+        self._reasoning = ReasoningAgent(llm_client, response_cache)
+        self._explainability = ExplainabilityAgent(llm_client, response_cache)
 
         # Build the graph
         self._graph = self._build_graph()
@@ -54,7 +59,7 @@ class GraphService:
         workflow = StateGraph(AssistantState)
 
         # Add nodes for each agent
-        workflow.add_node("router", self._router.execute)
+        workflow.add_node("router", self._route_with_prefetch)
         workflow.add_node("lookup", self._lookup.execute)
         workflow.add_node("reasoning", self._reasoning.execute)
         workflow.add_node("explainability", self._explainability.execute)
@@ -75,14 +80,42 @@ class GraphService:
         # After lookup, always go to reasoning
         workflow.add_edge("lookup", "reasoning")
 
-        # After reasoning, go to explainability
-        workflow.add_edge("reasoning", "explainability")
+        # After reasoning, explain the analysis; with nothing to explain
+        # (empty analysis or an earlier error) finish without the node
+        workflow.add_conditional_edges(
+            "reasoning",
+            self._route_after_reasoning,
+            {
+                "explainability": "explainability",
+                END: END,
+            },
+        )
 
         # Explainability is the final node
         workflow.add_edge("explainability", END)
 
         return workflow.compile()
 
+    async def _route_with_prefetch(self, state: AssistantState) -> Dict[str, Any]:
+        """
+        Run the router with a speculative general record search alongside it.
+
+        The search is the one LookupAgent runs when the router finds no
+        patient, and only then does Lookup reuse it instead of searching
+        again. It is wasted on patient queries, and on routes the router
+        answers from its cache, where the node still waits for the search.
+        """
+        updates, results = await asyncio.gather(
+            self._router.execute(state),
+            asyncio.to_thread(self._vector_store.search, query=state["query"], k=5),
+            return_exceptions=True,
+        )
+        if isinstance(updates, BaseException):
+            raise updates
+        if not isinstance(results, BaseException):
+            updates["prefetched_results"] = results
+        return updates
+
     def _route_after_router(self, state: AssistantState) -> str:
         """
         Determine next step after routing.
@@ -94,7 +127,18 @@ class GraphService:
             return "lookup"
         return "reasoning"
 
-    def process_query(self, query: str) -> str:
+    def _route_after_reasoning(self, state: AssistantState) -> str:
+        """
+        Determine next step after reasoning.
+
+        Mirrors ExplainabilityAgent._should_skip, so the skip path never
+        enters the agent at all.
+        """
+        if state.get("analysis") and not state.get("error"):
+            return "explainability"
+        return END
+
+    async def process_query(self, query: str) -> str:
         """
         Process a doctor's query through the agent pipeline.
 
@@ -104,27 +148,12 @@ class GraphService:
         Returns:
             The final response with explanations.
         """
-        # Initialize state
-        initial_state: AssistantState = {
-            "query": query,
-            "patient_identifier": None,
-            "query_type": "",
-            "requires_patient_context": False,
-            "patient_context": "",
-            "search_successful": False,
-            "analysis": "",
-            "explained_analysis": "",
-            "final_response": "",
-            "messages": [],
-            "error": None,
-        }
-
         # Run the graph
-        result = self._graph.invoke(initial_state)
+        result = await self._graph.ainvoke(self._initial_state(query))
 
         return result.get("explained_analysis", "Unable to process query.")
 
-    def get_workflow_trace(self, query: str) -> dict:
+    async def get_workflow_trace(self, query: str) -> dict:
         """
         Process query and return full workflow trace for debugging.
 
@@ -134,11 +163,49 @@ class GraphService:
         Returns:
             Complete state after workflow execution.
         """
-        initial_state: AssistantState = {
+        return await self._graph.ainvoke(self._initial_state(query))
+
+    async def stream_query(self, query: str) -> AsyncIterator[str]:
+        """
+        Process a query, yielding the final response as it is generated.
+
+        Tokens of the explainability node's LLM call are yielded as they
+        arrive. When that node produced no tokens (cached response, or the
+        node was skipped), the final response is yielded whole at the end.
+
+        Args:
+            query: The doctor's question about a patient.
+
+        Yields:
+            Consecutive pieces of the final response.
+        """
+        streamed = False
+        final_state: Dict[str, Any] = {}
+
+        async for mode, payload in self._graph.astream(
+            self._initial_state(query),
+            stream_mode=["messages", "values"],
+        ):
+            if mode == "values":
+                final_state = payload
+                continue
+            chunk, metadata = payload
+            if metadata.get("langgraph_node") == "explainability" and chunk.content:
+                streamed = True
+                yield chunk.content
+
+        if not streamed:
+            yield final_state.get("explained_analysis", "Unable to process query.")
+
+    @staticmethod
+    def _initial_state(query: str) -> AssistantState:
+        """Build the workflow state a query starts from."""
+        return {
             "query": query,
             "patient_identifier": None,
             "query_type": "",
             "requires_patient_context": False,
+            "prefetched_results": None,
             "patient_context": "",
             "search_successful": False,
             "analysis": "",
@@ -147,5 +214,3 @@ class GraphService:
             "messages": [],
             "error": None,
         }
-
-        return self._graph.invoke(initial_state)